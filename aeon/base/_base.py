@@ -268,6 +268,15 @@ class BaseObject(_BaseEstimator):
             class attribute via nested inheritance. NOT overridden by dynamic
             tags set by set_tags or mirror_tags.
         """
+        return deepcopy(cls._collect_class_tags())
+
+    @classmethod
+    def _collect_class_tags(cls):
+        """Collect class tags via nested inheritance, without copying tag values.
+
+        Callers must not mutate the returned tag values, these are the values
+        in the _tags class attributes.
+        """
         collected_tags = dict()
 
         # We exclude the last two parent classes: sklearn.base.BaseEstimator and
@@ -280,7 +289,7 @@ class BaseObject(_BaseEstimator):
                 more_tags = parent_class._tags
                 collected_tags.update(more_tags)
 
-        return deepcopy(collected_tags)
+        return collected_tags
 
     @classmethod
     def get_class_tag(cls, tag_name, tag_value_default=None, raise_error=False):
@@ -319,14 +328,16 @@ class BaseObject(_BaseEstimator):
         >>> DummyClassifier.get_class_tag("capability:multivariate")
         True
         """
-        collected_tags = cls.get_class_tags()
+        collected_tags = cls._collect_class_tags()
 
-        tag_value = collected_tags.get(tag_name, tag_value_default)
+        if tag_name in collected_tags:
+            # only the requested value is copied, not all tags
+            return deepcopy(collected_tags[tag_name])
 
-        if raise_error and tag_name not in collected_tags.keys():
+        if raise_error:
             raise ValueError(f"Tag with name {tag_name} could not be found.")
 
-        return tag_value
+        return tag_value_default
 
     def get_tags(self):
         """
@@ -353,7 +364,7 @@ class BaseObject(_BaseEstimator):
         >>> d = DummyClassifier()
         >>> tags = d.get_tags()
         """
-        collected_tags = self.get_class_tags()
+        collected_tags = self._collect_class_tags()
 
         if hasattr(self, "_tags_dynamic"):
             collected_tags.update(self._tags_dynamic)
@@ -399,14 +410,19 @@ class BaseObject(_BaseEstimator):
         >>> d.get_tag("capability:multivariate")
         True
         """
-        collected_tags = self.get_tags()
+        collected_tags = self._collect_class_tags()
+
+        if hasattr(self, "_tags_dynamic"):
+            collected_tags.update(self._tags_dynamic)
 
-        tag_value = collected_tags.get(tag_name, tag_value_default)
+        if tag_name in collected_tags:
+            # only the requested value is copied, not all tags
+            return deepcopy(collected_tags[tag_name])
 
-        if raise_error and tag_name not in collected_tags.keys():
+        if raise_error:
             raise ValueError(f"Tag with name {tag_name} could not be found.")
 
-        return tag_value
+        return tag_value_default
 
     def set_tags(self, **tag_dict):
         """
@@ -698,6 +698,36 @@ class _HeterogenousMetaEstimator:
         else:
             self.set_tags(**{mid_tag_name: mid_tag_val_not})
 
+    def _snapshot_tags(self, estimators):
+        """Return estimators with their tags collected once, for the tag helpers.
+
+        ``get_tag`` collects all tags of an estimator on each call. Passing the
+        return to `_anytagis_then_set`, `_anytag_notnone_set`, `_tagchain_is_linked_set`
+        and similar, instead of `estimators`, collects the tags once per estimator.
+
+        Parameters
+        ----------
+        estimators : list of (str, estimator) pairs
+
+        Returns
+        -------
+        list of (str, _ComponentTags) pairs, with the same names as `estimators`
+        """
+        return [(name, _ComponentTags(est)) for name, est in estimators]
+
+
+class _ComponentTags:
+    """Tags of an estimator collected once, supporting its `get_tag` interface."""
+
+    def __init__(self, estimator):
+        self._tags = estimator.get_tags()
+
+    def get_tag(self, tag_name, tag_value_default=None, raise_error=True):
+        """Get tag value, as `BaseObject.get_tag` of the estimator at collection."""
+        if raise_error and tag_name not in self._tags:
+            raise ValueError(f"Tag with name {tag_name} could not be found.")
+        return self._tags.get(tag_name, tag_value_default)
+
 
 def flatten(obj):
     """Flatten nested list/tuple structure.
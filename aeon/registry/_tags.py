@@ -95,6 +95,12 @@ ESTIMATOR_TAG_REGISTER = [
         "bool",
         "behaviour flag: skips inverse_transform when called yes/no",
     ),
+    (
+        "transform-is-identity",
+        "transformer",
+        "bool",
+        "do transform and inverse_transform return X unchanged, without conversion?",
+    ),
     (
         "requires-fh-in-fit",
         "forecaster",
@@ -2,7 +2,7 @@
 
 import numpy as np
 import pandas as pd
-from sklearn.utils import check_random_state
+from numba import njit
 
 
 def make_series(
@@ -26,8 +26,8 @@ def make_series(
         Only positive values or not.
     index_type : pd.PeriodIndex or None, default = None
         pandas Index type to use.
-    random_state : inst, str, float, default=None
-        Set seed of random state
+    random_state : int, RandomState, Generator or None, default = None
+        Seed or random number generator used to generate the series.
     add_nan : bool, default = False
         Add nan values to the series.
 
@@ -38,27 +38,54 @@ def make_series(
         pd.Series if n_columns == 1
         else pd.DataFrame
     """
-    rng = check_random_state(random_state)
-    data = rng.normal(size=(n_timepoints, n_columns))
+    if random_state is None:
+        # the public np.random functions draw from the global numpy RandomState,
+        # as the one sklearn's check_random_state returns
+        rng = np.random
+    elif isinstance(random_state, (np.random.RandomState, np.random.Generator)):
+        rng = random_state
+    else:
+        rng = np.random.RandomState(random_state)
+    if n_columns == 1:
+        data = rng.normal(size=n_timepoints)
+    else:
+        data = rng.normal(size=(n_timepoints, n_columns))
     if add_nan:
         # add some nan values
-        data[len(data) // 2] = np.nan
-        data[0] = np.nan
-        data[-1] = np.nan
+        data[[0, n_timepoints // 2, n_timepoints - 1]] = np.nan
     if all_positive:
-        data -= np.min(data, axis=0) - 1
+        # reshape gives a 2D view, so the 1D case is shifted in place too
+        _shift_positive(data.reshape(n_timepoints, n_columns))
     if return_numpy:
-        if n_columns == 1:
-            data = data.ravel()
         return data
     else:
         index = _make_index(n_timepoints, index_type)
         if n_columns == 1:
-            return pd.Series(data.ravel(), index)
+            return pd.Series(data, index)
         else:
             return pd.DataFrame(data, index)
 
 
+@njit(cache=True)
+def _shift_positive(data):
+    """Shift each column in place so that its minimum is 1.
+
+    Columns containing NaN become all NaN, matching ``data -= np.min(data) - 1``.
+    """
+    n_timepoints, n_columns = data.shape
+    for j in range(n_columns):
+        mn = data[0, j]
+        for i in range(1, n_timepoints):
+            if np.isnan(data[i, j]):
+                mn = np.nan
+                break
+            if data[i, j] < mn:
+                mn = data[i, j]
+        mn -= 1.0
+        for i in range(n_timepoints):
+            data[i, j] -= mn
+
+
 def _make_index(n_timepoints, index_type=None):
     """Make indices for unit testing."""
     if index_type == "period":
@@ -8,15 +8,28 @@ __all__ = [
     "make_example_dataframe_series",
 ]
 
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Union
 
 import numpy as np
 import pandas as pd
 
+# number of uniform values pre-drawn and cached per integer seed
+_POOL_BLOCK_SIZE = 4096
+# draws larger than this are split over threads with independent generators
+_PARALLEL_THRESHOLD = 1 << 20
+_PARALLEL_N_THREADS = 4
+# shared generator for unseeded draws, avoiding an OS entropy read per call
+_DEFAULT_RNG = np.random.default_rng()
+
 
 def make_example_1d_numpy(
     n_timepoints: int = 12,
     random_state: Union[int, None] = None,
+    dtype: np.dtype = np.float64,
+    out: Union[np.ndarray, None] = None,
 ) -> np.ndarray:
     """Randomly generate 1D numpy X.
 
@@ -28,6 +41,11 @@ def make_example_1d_numpy(
         The number of features/series length to generate.
     random_state : int or None, default=None
         Seed for random number generation.
+    dtype : np.dtype, default=np.float64
+        The floating point type of the generated data, np.float32 or np.float64.
+    out : np.ndarray or None, default=None
+        Pre-allocated C-contiguous array to write the generated data into and
+        return. Must have the output shape, and its dtype overrides ``dtype``.
 
     Returns
     -------
@@ -42,11 +60,10 @@ def make_example_1d_numpy(
     ...     random_state=0,
     ... )
     >>> print(data)
-    [0.5488135  0.71518937 0.60276338 0.54488318 0.4236548  0.64589411
-     0.43758721 0.891773  ]
+    [0.63696169 0.26978671 0.04097352 0.01652764 0.81327024 0.91275558
+     0.60663578 0.72949656]
     """
-    rng = np.random.RandomState(random_state)
-    return rng.uniform(size=(n_timepoints,))
+    return _random((n_timepoints,), random_state, dtype, out)
 
 
 def make_example_2d_numpy_series(
@@ -54,6 +71,8 @@ def make_example_2d_numpy_series(
     n_channels: int = 1,
     random_state: Union[int, None] = None,
     axis: int = 1,
+    dtype: np.dtype = np.float64,
+    out: Union[np.ndarray, None] = None,
 ) -> np.ndarray:
     """Randomly generate 2D numpy X.
 
@@ -70,6 +89,14 @@ def make_example_2d_numpy_series(
     axis : int, default=1
         The axis to for the series timepoints. If 1, returns the shape
         (n_channels, n_timepoints). If 0, returns the shape (n_timepoints, n_channels).
+        In both cases the values of each channel are contiguous in memory, so the
+        axis=0 output is Fortran ordered.
+    dtype : np.dtype, default=np.float64
+        The floating point type of the generated data, np.float32 or np.float64.
+    out : np.ndarray or None, default=None
+        Pre-allocated array to write the generated data into and return. Must
+        have the output shape and be C-contiguous for axis=1 or Fortran-contiguous
+        for axis=0. Its dtype overrides ``dtype``.
 
     Returns
     -------
@@ -86,18 +113,27 @@ def make_example_2d_numpy_series(
     ...     axis=0,
     ... )
     >>> print(data)
-    [[0.5488135  0.71518937]
-     [0.60276338 0.54488318]
-     [0.4236548  0.64589411]
-     [0.43758721 0.891773  ]
-     [0.96366276 0.38344152]
-     [0.79172504 0.52889492]]
+    [[0.63696169 0.60663578]
+     [0.26978671 0.72949656]
+     [0.04097352 0.54362499]
+     [0.01652764 0.93507242]
+     [0.81327024 0.81585355]
+     [0.91275558 0.0027385 ]]
     """
-    rng = np.random.RandomState(random_state)
     if axis == 1:
-        return rng.uniform(size=(n_channels, n_timepoints))
+        return _random((n_channels, n_timepoints), random_state, dtype, out)
     elif axis == 0:
-        return rng.uniform(size=(n_timepoints, n_channels))
+        # draw channel-major and transpose, so each channel is contiguous in the
+        # returned Fortran ordered array
+        if out is None:
+            return _random((n_channels, n_timepoints), random_state, dtype).T
+        if out.shape != (n_timepoints, n_channels) or not out.flags.f_contiguous:
+            raise ValueError(
+                "out must be a Fortran-contiguous array of shape "
+                f"{(n_timepoints, n_channels)} when axis=0, found shape {out.shape}."
+            )
+        _random((n_channels, n_timepoints), random_state, dtype, out.T)
+        return out
     else:
         raise ValueError(f"axis: {axis} is not supported, please use 0 or 1.")
 
@@ -106,6 +142,7 @@ def make_example_pandas_series(
     n_timepoints: int = 12,
     index_type=None,
     random_state: Union[int, None] = None,
+    dtype: np.dtype = np.float64,
 ) -> pd.Series:
     """Randomly generate pandas Series X.
 
@@ -120,6 +157,8 @@ def make_example_pandas_series(
         If None, uses default integer index.
     random_state : int or None, default=None
         Seed for random number generation.
+    dtype : np.dtype, default=np.float64
+        The floating point type of the generated data, np.float32 or np.float64.
 
     Returns
     -------
@@ -134,17 +173,16 @@ def make_example_pandas_series(
     ...     random_state=0,
     ... )
     >>> print(data)
-    0    0.548814
-    1    0.715189
-    2    0.602763
-    3    0.544883
-    4    0.423655
-    5    0.645894
+    0    0.636962
+    1    0.269787
+    2    0.040974
+    3    0.016528
+    4    0.813270
+    5    0.912756
     dtype: float64
     """
-    rng = np.random.RandomState(random_state)
     index = _make_index(n_timepoints, index_type)
-    return pd.Series(rng.uniform(size=(n_timepoints,)), index=index)
+    return pd.Series(_random((n_timepoints,), random_state, dtype), index=index)
 
 
 def make_example_dataframe_series(
@@ -153,6 +191,7 @@ def make_example_dataframe_series(
     index_type=None,
     random_state: Union[int, None] = None,
     axis: int = 1,
+    dtype: np.dtype = np.float64,
 ) -> pd.DataFrame:
     """Randomly generate pandas DataFrame X.
 
@@ -172,6 +211,8 @@ def make_example_dataframe_series(
     axis : int, default=1
         The axis to for the series timepoints. If 1, returns the shape
         (n_channels, n_timepoints). If 0, returns the shape (n_timepoints, n_channels).
+    dtype : np.dtype, default=np.float64
+        The floating point type of the generated data, np.float32 or np.float64.
 
     Returns
     -------
@@ -189,24 +230,25 @@ def make_example_dataframe_series(
     ... )
     >>> print(data)
               0         1
-    0  0.548814  0.715189
-    1  0.602763  0.544883
-    2  0.423655  0.645894
-    3  0.437587  0.891773
-    4  0.963663  0.383442
-    5  0.791725  0.528895
+    0  0.636962  0.606636
+    1  0.269787  0.729497
+    2  0.040974  0.543625
+    3  0.016528  0.935072
+    4  0.813270  0.815854
+    5  0.912756  0.002739
     """
-    rng = np.random.RandomState(random_state)
     index = _make_index(n_timepoints, index_type)
     if axis == 1:
         return pd.DataFrame(
-            rng.uniform(size=(n_channels, n_timepoints)),
+            _random((n_channels, n_timepoints), random_state, dtype),
             index=np.arange(n_channels),
             columns=index,
         )
     elif axis == 0:
+        # draw channel-major so each column is a contiguous row of the buffer
+        # pandas stores internally, avoiding a copy on construction
         return pd.DataFrame(
-            rng.uniform(size=(n_timepoints, n_channels)),
+            _random((n_channels, n_timepoints), random_state, dtype).T,
             columns=np.arange(n_channels),
             index=index,
         )
@@ -214,15 +256,98 @@ def make_example_dataframe_series(
         raise ValueError(f"axis: {axis} is not supported, please use 0 or 1.")
 
 
+def _random(shape, random_state=None, dtype=np.float64, out=None):
+    """Draw uniform values in [0, 1) of the given shape and dtype.
+
+    Small draws for integer seeds are served from a cached block, which gives
+    the same values as ``np.random.default_rng(random_state).random(shape)``
+    without constructing a new generator on every call. Draws of more than
+    ``_PARALLEL_THRESHOLD`` values are filled in parallel by generators spawned
+    from the seed, so they are reproducible but differ from a single generator.
+    Values are always drawn into a flat buffer and reshaped as a view, so
+    degenerate shapes such as (n_timepoints, 1) cost a single contiguous
+    allocation. If ``out`` is given, values are written into it instead of a new
+    array.
+    """
+    if out is not None:
+        if out.shape != tuple(shape) or not out.flags.c_contiguous:
+            raise ValueError(
+                f"out must be a C-contiguous array of shape {shape}, found "
+                f"shape {out.shape}."
+            )
+        dtype = out.dtype
+    dtype = np.dtype(dtype)
+    n_values = math.prod(shape)
+    if isinstance(random_state, (int, np.integer)) and n_values <= _POOL_BLOCK_SIZE:
+        block = _random_block(int(random_state), dtype)[:n_values]
+        if out is None:
+            return block.reshape(shape).copy()
+        out.reshape(n_values)[:] = block
+        return out
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    if n_values > _PARALLEL_THRESHOLD:
+        _parallel_random(out.reshape(n_values), random_state)
+    else:
+        rng = (
+            _DEFAULT_RNG
+            if random_state is None
+            else np.random.default_rng(random_state)
+        )
+        rng.random(dtype=dtype, out=out)
+    return out
+
+
+def _parallel_random(out, random_state=None):
+    """Fill a flat array with uniform values using several threads.
+
+    The array is split into contiguous slabs, each filled by a generator from a
+    child of the seed's ``SeedSequence``. numpy releases the GIL while drawing.
+    """
+    seeds = np.random.SeedSequence(random_state).spawn(_PARALLEL_N_THREADS)
+    slabs = np.array_split(out, _PARALLEL_N_THREADS)
+
+    def _fill(seed, slab):
+        np.random.default_rng(seed).random(dtype=out.dtype, out=slab)
+
+    with ThreadPoolExecutor(max_workers=_PARALLEL_N_THREADS) as executor:
+        list(executor.map(_fill, seeds, slabs))
+
+
+@lru_cache(maxsize=32)
+def _random_block(seed, dtype):
+    """Return a read-only block of uniform values for a seed and dtype."""
+    block = np.random.default_rng(seed).random(size=_POOL_BLOCK_SIZE, dtype=dtype)
+    block.flags.writeable = False
+    return block
+
+
+@lru_cache(maxsize=128)
+def _period_index(n_timepoints):
+    """Make a cached monthly PeriodIndex."""
+    return pd.period_range(start="2000-01", periods=n_timepoints, freq="M")
+
+
+@lru_cache(maxsize=128)
+def _datetime_index(n_timepoints):
+    """Make a cached daily DatetimeIndex."""
+    return pd.date_range(start="2000-01-01", periods=n_timepoints, freq="D")
+
+
+# the cached indices are shallow copied so setting e.g. a name on a returned
+# index does not leak into later calls
+_INDEX_BUILDERS = {
+    "period": lambda n: _period_index(n).copy(),
+    "datetime": lambda n: _datetime_index(n).copy(),
+    "range": lambda n: pd.RangeIndex(start=0, stop=n),
+    "int": lambda n: pd.RangeIndex(start=0, stop=n),
+    None: lambda n: pd.RangeIndex(start=0, stop=n),
+}
+
+
 def _make_index(n_timepoints, index_type=None):
     """Make indices for unit testing."""
-    if index_type == "period":
-        return pd.period_range(start="2000-01", periods=n_timepoints, freq="M")
-    elif index_type == "datetime":
-        return pd.date_range(start="2000-01-01", periods=n_timepoints, freq="D")
-    elif index_type == "range":
-        return pd.RangeIndex(start=0, stop=n_timepoints)
-    elif index_type == "int" or index_type is None:
-        return pd.Index(np.arange(0, n_timepoints), dtype=int)
-    else:
+    builder = _INDEX_BUILDERS.get(index_type)
+    if builder is None:
         raise ValueError(f"index_class: {index_type} is not supported")
+    return builder(n_timepoints)
@@ -88,7 +88,9 @@ def _make_hierarchical(
         data[0] = np.nan
         data[-1] = np.nan
     if all_positive:
-        data -= np.min(data, axis=0) - 1
+        col_min = np.min(data, axis=0)
+        col_min -= 1
+        np.subtract(data, col_min, out=data)
     df = pd.DataFrame(
         data=data, index=index, columns=[f"c{i}" for i in range(n_columns)]
     )
@@ -12,6 +12,7 @@ from aeon.testing.data_generation import (
     make_example_dataframe_series,
     make_example_pandas_series,
 )
+from aeon.testing.data_generation._series import _PARALLEL_THRESHOLD, _random
 from aeon.utils.validation import is_single_series
 
 N_CHANNELS = [1, 3]
@@ -38,6 +39,7 @@ def test_make_example_2d_numpy_series(n_timepoints, n_channels):
 
     assert isinstance(X, np.ndarray)
     assert X.shape == (n_timepoints, n_channels)
+    assert X.flags.f_contiguous
     assert is_single_series(X)
 
     X = make_example_2d_numpy_series(
@@ -46,6 +48,7 @@ def test_make_example_2d_numpy_series(n_timepoints, n_channels):
 
     assert isinstance(X, np.ndarray)
     assert X.shape == (n_channels, n_timepoints)
+    assert X.flags.c_contiguous
     assert is_single_series(X)
 
 
@@ -78,3 +81,42 @@ def test_make_example_dataframe_series(n_timepoints, n_channels):
     assert isinstance(X, pd.DataFrame)
     assert X.shape == (n_channels, n_timepoints)
     assert is_single_series(X)
+
+
+@pytest.mark.parametrize("shape", [(6,), (3, 10), (5000,)])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_random_matches_generator(shape, dtype):
+    """Test cached uniform draws match drawing from a fresh generator."""
+    X = _random(shape, random_state=0, dtype=dtype)
+    expected = np.random.default_rng(0).random(size=shape, dtype=dtype)
+
+    assert X.dtype == dtype
+    np.testing.assert_array_equal(X, expected)
+    assert X.flags.writeable
+
+    X[:] = 0
+    np.testing.assert_array_equal(_random(shape, random_state=0, dtype=dtype), expected)
+
+    out = np.empty(shape, dtype=dtype)
+    X = _random(shape, random_state=0, out=out)
+    assert X is out
+    np.testing.assert_array_equal(X, expected)
+
+
+def test_random_out_invalid():
+    """Test writing into an output array with the wrong shape or layout raises."""
+    with pytest.raises(ValueError, match="C-contiguous array of shape"):
+        _random((3, 10), out=np.empty((10, 3)))
+    with pytest.raises(ValueError, match="C-contiguous array of shape"):
+        _random((3, 10), out=np.empty((3, 10), order="F"))
+
+
+def test_random_parallel():
+    """Test large draws filled by several generators are seeded and reproducible."""
+    shape = (2, _PARALLEL_THRESHOLD)
+    X = _random(shape, random_state=0)
+
+    assert X.shape == shape
+    assert 0 <= X.min() and X.max() < 1
+    np.testing.assert_array_equal(X, _random(shape, random_state=0))
+    assert not np.array_equal(X, _random(shape, random_state=1))
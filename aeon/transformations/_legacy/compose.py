@@ -2,16 +2,19 @@
 
 from warnings import warn
 
+import joblib
 import numpy as np
 import pandas as pd
 from deprecated.sphinx import deprecated
+from joblib import Parallel, delayed
+from numba import njit
 from sklearn import clone
+from sklearn.utils.validation import check_memory
 
 from aeon.base import _HeterogenousMetaEstimator
-from aeon.testing.mock_estimators import MockTransformer
 from aeon.transformations._legacy._delegate import _DelegatedTransformer
 from aeon.transformations.base import BaseTransformer
-from aeon.utils.multiindex import flatten_multiindex
+from aeon.utils.multiindex import flatten_multiindex, underscore_join
 from aeon.utils.sklearn import is_sklearn_transformer
 from aeon.utils.validation.series import check_series
 
@@ -28,7 +31,6 @@ __all__ = [
     "TransformerPipeline",
     "YtoX",
 ]
-from aeon.transformations._legacy._boxcox import _BoxCoxTransformer
 from aeon.utils import ALL_TIME_SERIES_TYPES
 
 
@@ -43,6 +45,72 @@ def _coerce_to_aeon(other):
     return other
 
 
+# data_key is unused in the functions below, it is the cache key for X and y when
+# these are excluded from hashing, see _cache and _data_key
+def _fit_transform_one(transformer, X, y=None, data_key=None):
+    """Fit transformer to X and y, return the transformed X and fitted transformer."""
+    Xt = transformer.fit_transform(X=X, y=y)
+    return Xt, transformer
+
+
+def _fit_one(transformer, X, y=None, data_key=None):
+    """Fit transformer to X and y, return the fitted transformer."""
+    return transformer.fit(X=X, y=y)
+
+
+def _transform_one(transformer, X, y=None, data_key=None):
+    """Transform X with a fitted transformer."""
+    return transformer.transform(X=X, y=y)
+
+
+# number of rows of the data that are hashed by _fingerprint
+_FINGERPRINT_ROWS = 100
+
+
+def _fingerprint(X):
+    """Hash a sample of rows of X, including the first and last row.
+
+    Hashing cost does not grow with the size of X. numpy and pandas data of equal
+    shape which differ only in rows outside the sample get the same fingerprint, any
+    other types are hashed in full.
+    """
+    if isinstance(X, (pd.DataFrame, pd.Series)):
+        sample = X.iloc[_fingerprint_rows(len(X))]
+    elif isinstance(X, np.ndarray) and X.ndim > 0:
+        sample = X[_fingerprint_rows(len(X))]
+    else:
+        return joblib.hash(X)
+    return joblib.hash((type(X).__name__, X.shape, sample))
+
+
+def _fingerprint_rows(n_rows):
+    """Return equally spaced row positions, including the first and last row."""
+    rows = np.linspace(0, n_rows - 1, min(n_rows, _FINGERPRINT_ROWS))
+    return np.unique(rows.astype(np.int64))
+
+
+def _cache(memory, func, memory_hash):
+    """Cache func in memory, hashing X and y as given by memory_hash.
+
+    Calls of the returned function should pass ``data_key=_data_key(X, y, memory_hash)``
+    so that X and y are part of the cache key if memory_hash is "fingerprint".
+    """
+    if memory_hash == "joblib":
+        return memory.cache(func)
+    elif memory_hash == "fingerprint":
+        return memory.cache(func, ignore=["X", "y"])
+    raise ValueError(
+        f'memory_hash must be "joblib" or "fingerprint", but found: {memory_hash}'
+    )
+
+
+def _data_key(X, y, memory_hash):
+    """Return the data_key for functions cached by _cache."""
+    if memory_hash == "fingerprint":
+        return _fingerprint(X), _fingerprint(y)
+    return None
+
+
 # TODO: remove in v0.11.0
 @deprecated(
     version="0.10.0",
@@ -100,6 +168,22 @@ class TransformerPipeline(_HeterogenousMetaEstimator, BaseTransformer):
     steps : list of aeon transformers, or
         List of tuples (str, transformer) of aeon transformers
         these are "blueprint" transformers, states do not change when `fit` is called.
+    memory : None, str or object with the joblib.Memory interface, default=None
+        Used to cache the fitted transformers and transform outputs of the pipeline.
+        If a string is given, it is the path to the caching directory. By default,
+        no caching is performed. On a cache hit, the fitted transformers are loaded
+        from the cache and replace the entries of `steps_`, so the instances in
+        `steps_` are not fitted in place and may change between calls.
+        Unlike `sklearn` `Pipeline`, the final step is cached too, since the
+        pipeline contains no final estimator: it is fitted by a separately cached
+        `fit` call, and `transform` calls of every step are cached.
+    memory_hash : str, default="joblib"
+        How the data is hashed to look up cached results, if `memory` is used.
+        If "joblib", the data is hashed in full by `joblib.hash`, which can dominate
+        run time for large data. If "fingerprint", only the shape and a sample of
+        100 rows, including the first and last, of numpy and pandas data are hashed,
+        at constant cost. Data differing only in rows outside the sample then
+        collides, and cached results for the other data are returned.
 
     Attributes
     ----------
@@ -129,15 +213,19 @@ class TransformerPipeline(_HeterogenousMetaEstimator, BaseTransformer):
     # this must be an iterable of (name: str, estimator, ...) tuples for the default
     _steps_fitted_attr = "steps_"
 
-    def __init__(self, steps):
+    def __init__(self, steps, memory=None, memory_hash="joblib"):
         self.steps = steps
+        self.memory = memory
+        self.memory_hash = memory_hash
         self.steps_ = self._check_estimators(self.steps, cls_type=BaseTransformer)
+        # steps that steps_ was checked from, holding the reference keeps it unique
+        self._checked_steps = self.steps
 
         super().__init__()
 
-        # abbreviate for readability
-        ests = self.steps_
-        first_trafo = ests[0][1]
+        # abbreviate for readability, tags of steps are collected once
+        ests = self._snapshot_tags(self.steps_)
+        first_trafo = self.steps_[0][1]
         last_trafo = ests[-1][1]
 
         self.clone_tags(first_trafo, ["input_data_type"])
@@ -163,6 +251,17 @@ class TransformerPipeline(_HeterogenousMetaEstimator, BaseTransformer):
         can_inv = [x or y for x, y in zip(skips, has_invs)]
         self.set_tags(**{"capability:inverse_transform": all(can_inv)})
 
+        # positions of steps that change the data, identity steps are passed over in
+        #   transform, and steps that skip inverse_transform in inverse_transform
+        self._transform_idx = [
+            i
+            for i, (_, est) in enumerate(ests)
+            if not est.get_tag("transform-is-identity", False)
+        ]
+        self._inverse_transform_idx = [
+            i for i in reversed(self._transform_idx) if not skips[i]
+        ]
+
         # can handle missing data iff all estimators can handle missing data
         #   up to a potential estimator when missing data is removed
         # removes missing data iff can handle missing data,
@@ -251,13 +350,70 @@ class TransformerPipeline(_HeterogenousMetaEstimator, BaseTransformer):
         -------
         self: reference to self
         """
-        self.steps_ = self._check_estimators(self.steps, cls_type=BaseTransformer)
+        self._fit_steps(X, y, transform_last=False)
+        return self
+
+    def _fit_transform(self, X, y=None):
+        """Fit to data, then transform it.
+
+        private _fit_transform containing the core logic, called from fit_transform.
+        Each step is fitted and applied once, rather than in _fit and again in
+        _transform.
+
+        Parameters
+        ----------
+        X: data structure of type X_inner_type
+            if X_inner_type is list, _fit_transform must support all types in it
+            Data to fit transform to
+        y : Series or Panel of type y_inner_type, default=None
+            Additional data, e.g., labels for transformation
+
+        Returns
+        -------
+        transformed version of X
+        """
+        return self._fit_steps(X, y, transform_last=True)
+
+    def _fit_steps(self, X, y, transform_last):
+        """Fit the steps in sequence, each on the output of the previous step.
+
+        Fitted steps are written to steps_, and restored from memory on a cache hit.
+        The final step is only fitted if transform_last is False.
+
+        Returns
+        -------
+        Xt : output of the last step if transform_last is True, otherwise the input
+            of the last step
+        """
+        # steps_ is already checked in __init__, fit resets self before _fit
+        if self.steps is not self._checked_steps:
+            self.steps_ = self._check_estimators(self.steps, cls_type=BaseTransformer)
+            self._checked_steps = self.steps
 
+        memory = check_memory(self.memory)
+        fit_transform_one_cached = _cache(memory, _fit_transform_one, self.memory_hash)
+        cached = self.memory is not None
+
+        n_transformed = len(self.steps_) if transform_last else len(self.steps_) - 1
         Xt = X
-        for _, transformer in self.steps_:
-            Xt = transformer.fit_transform(X=Xt, y=y)
+        for i, (name, transformer) in enumerate(self.steps_[:n_transformed]):
+            data_key = _data_key(Xt, y, self.memory_hash) if cached else None
+            Xt, fitted_transformer = fit_transform_one_cached(
+                transformer, Xt, y, data_key=data_key
+            )
+            # on a cache hit, the fitted transformer is restored from the cache
+            self.steps_[i] = (name, fitted_transformer)
+        if not transform_last:
+            # the final step output is not needed in fit, so only its fit is cached
+            fit_one_cached = _cache(memory, _fit_one, self.memory_hash)
+            name, transformer = self.steps_[-1]
+            data_key = _data_key(Xt, y, self.memory_hash) if cached else None
+            self.steps_[-1] = (
+                name,
+                fit_one_cached(transformer, Xt, y, data_key=data_key),
+            )
 
-        return self
+        return Xt
 
     def _transform(self, X, y=None):
         """Transform X and return a transformed version.
@@ -276,10 +432,17 @@ class TransformerPipeline(_HeterogenousMetaEstimator, BaseTransformer):
         -------
         transformed version of X
         """
+        memory = check_memory(self.memory)
+        transform_one_cached = _cache(memory, _transform_one, self.memory_hash)
+        cached = self.memory is not None
+
+        fit_is_empty = self.get_tag("fit_is_empty", False)
         Xt = X
-        for _, transformer in self.steps_:
-            if not self.get_tag("fit_is_empty", False):
-                Xt = transformer.transform(X=Xt, y=y)
+        for i in self._transform_idx:
+            transformer = self.steps_[i][1]
+            if not fit_is_empty:
+                data_key = _data_key(Xt, y, self.memory_hash) if cached else None
+                Xt = transform_one_cached(transformer, Xt, y, data_key=data_key)
             else:
                 Xt = transformer.fit_transform(X=Xt, y=y)
 
@@ -302,9 +465,11 @@ class TransformerPipeline(_HeterogenousMetaEstimator, BaseTransformer):
         -------
         inverse transformed version of X
         """
+        fit_is_empty = self.get_tag("fit_is_empty", False)
         Xt = X
-        for _, transformer in reversed(self.steps_):
-            if not self.get_tag("fit_is_empty", False):
+        for i in self._inverse_transform_idx:
+            transformer = self.steps_[i][1]
+            if not fit_is_empty:
                 Xt = transformer.inverse_transform(X=Xt, y=y)
             else:
                 Xt = transformer.fit(X=Xt, y=y).inverse_transform(X=Xt, y=y)
@@ -329,7 +494,8 @@ class TransformerPipeline(_HeterogenousMetaEstimator, BaseTransformer):
         self: reference to self
         """
         Xt = X
-        for _, transformer in self.steps_:
+        for i in self._transform_idx:
+            transformer = self.steps_[i][1]
             transformer.update(X=Xt, y=y)
             Xt = transformer.transform(X=Xt, y=y)
 
@@ -406,6 +572,13 @@ class FeatureUnion(_HeterogenousMetaEstimator, BaseTransformer):
         if True, columns of return DataFrame are flat, by "transformer__variablename"
         if False, columns are MultiIndex (transformer, variablename)
         has no effect if return type is one without column names
+    parallel_backend : str, ParallelBackendBase instance or None, default=None
+        Specify the parallelisation backend implementation in joblib, if None a 'prefer'
+        value of "threads" is used by default, which avoids copying the data to each
+        worker. Components which hold the GIL, e.g., pure python transformers, may run
+        faster with "loky".
+        Valid options are "loky", "multiprocessing", "threading" or a custom backend.
+        See the joblib Parallel documentation for more details.
     """
 
     _tags = {
@@ -443,20 +616,20 @@ class FeatureUnion(_HeterogenousMetaEstimator, BaseTransformer):
         n_jobs=None,
         transformer_weights=None,
         flatten_transform_index=True,
+        parallel_backend=None,
     ):
         self.transformer_list = transformer_list
-        self.transformer_list_ = self._check_estimators(
-            transformer_list, cls_type=BaseTransformer
-        )
+        self._set_transformer_list_(transformer_list)
 
         self.n_jobs = n_jobs
         self.transformer_weights = transformer_weights
         self.flatten_transform_index = flatten_transform_index
+        self.parallel_backend = parallel_backend
 
         super().__init__()
 
-        # abbreviate for readability
-        ests = self.transformer_list_
+        # abbreviate for readability, tags of transformers are collected once
+        ests = self._snapshot_tags(self.transformer_list_)
 
         # set property tags based on tags of components
         self._anytag_notnone_set("y_inner_type", ests)
@@ -478,7 +651,30 @@ class FeatureUnion(_HeterogenousMetaEstimator, BaseTransformer):
     @_transformer_list.setter
     def _transformer_list(self, value):
         self.transformer_list = value
-        self.transformer_list_ = self._check_estimators(value, cls_type=BaseTransformer)
+        self._set_transformer_list_(value)
+
+    def _set_transformer_list_(self, transformer_list):
+        """Check transformer_list and set transformer_list_ to the active transformers.
+
+        Transformers set to "drop" or None are removed, the others are cloned.
+        """
+        active = transformer_list
+        if isinstance(transformer_list, list):
+            active = [
+                x
+                for x in transformer_list
+                if not (_is_drop(x) or isinstance(x, tuple) and _is_drop(x[-1]))
+            ]
+            if transformer_list and not active:
+                raise ValueError(
+                    "all transformers in transformer_list are dropped, at least one "
+                    "transformer must not be 'drop' or None"
+                )
+        self.transformer_list_ = self._check_estimators(
+            active, cls_type=BaseTransformer
+        )
+        # list that transformer_list_ was checked from
+        self._checked_transformer_list = transformer_list
 
     def __add__(self, other):
         """Magic + method, return (right) concatenated FeatureUnion.
@@ -542,12 +738,21 @@ class FeatureUnion(_HeterogenousMetaEstimator, BaseTransformer):
         -------
         self: reference to self
         """
-        self.transformer_list_ = self._check_estimators(
-            self.transformer_list, cls_type=BaseTransformer
+        # transformer_list_ is already checked in __init__, fit resets self before _fit
+        if self.transformer_list is not self._checked_transformer_list:
+            self._set_transformer_list_(self.transformer_list)
+
+        # fitted transformers are returned, as workers may fit copies
+        fitted = Parallel(
+            n_jobs=self.n_jobs, backend=self.parallel_backend, prefer="threads"
+        )(
+            delayed(_fit_one)(transformer, X, y)
+            for _, transformer in self.transformer_list_
         )
-
-        for _, transformer in self.transformer_list_:
-            transformer.fit(X=X, y=y)
+        self.transformer_list_ = [
+            (name, transformer)
+            for (name, _), transformer in zip(self.transformer_list_, fitted)
+        ]
 
         return self
 
@@ -570,12 +775,42 @@ class FeatureUnion(_HeterogenousMetaEstimator, BaseTransformer):
         # retrieve fitted transformers, apply to the new data individually
         transformers = self._get_estimator_list(self.transformer_list_)
         if not self.get_tag("fit_is_empty", False):
-            Xt_list = [trafo.transform(X, y) for trafo in transformers]
+            Xt_list = Parallel(
+                n_jobs=self.n_jobs, backend=self.parallel_backend, prefer="threads"
+            )(delayed(_transform_one)(trafo, X, y) for trafo in transformers)
         else:
-            Xt_list = [trafo.fit_transform(X, y) for trafo in transformers]
+            Xt_list = Parallel(
+                n_jobs=self.n_jobs, backend=self.parallel_backend, prefer="threads"
+            )(delayed(_fit_transform_one)(trafo, X, y) for trafo in transformers)
+            Xt_list = [Xt for Xt, _ in Xt_list]
 
         transformer_names = self._get_estimator_names(self.transformer_list_)
 
+        if self.transformer_weights is not None:
+            # replace outputs one at a time, so only one weighted copy is alive
+            for i, name in enumerate(transformer_names):
+                if name in self.transformer_weights:
+                    Xt_list[i] = Xt_list[i] * self.transformer_weights[name]
+
+        if _is_aligned_numeric_frames(Xt_list):
+            return _hstack_frames(
+                Xt_list, transformer_names, self.flatten_transform_index
+            )
+
+        if self.flatten_transform_index and all(
+            isinstance(Xt, pd.DataFrame) and not isinstance(Xt.columns, pd.MultiIndex)
+            for Xt in Xt_list
+        ):
+            # flat column names are built directly, without a MultiIndex to flatten
+            columns = [
+                underscore_join((name, col))
+                for name, Xt in zip(transformer_names, Xt_list)
+                for col in Xt.columns
+            ]
+            Xt = pd.concat(Xt_list, axis=1)
+            Xt.columns = columns
+            return Xt
+
         Xt = pd.concat(
             Xt_list, axis=1, keys=transformer_names, names=["transformer", "variable"]
         )
@@ -588,6 +823,8 @@ class FeatureUnion(_HeterogenousMetaEstimator, BaseTransformer):
     @classmethod
     def get_test_params(cls, parameter_set="default"):
         """Test parameters for FeatureUnion."""
+        from aeon.testing.mock_estimators import MockTransformer
+
         # with name and estimator tuple, all transformers don't have fit
         TRANSFORMERS = [
             ("transformer1", MockTransformer(power=4)),
@@ -596,6 +833,58 @@ class FeatureUnion(_HeterogenousMetaEstimator, BaseTransformer):
         return {"transformer_list": TRANSFORMERS}
 
 
+def _is_drop(transformer):
+    """Check if transformer is a placeholder for a removed transformer."""
+    return transformer is None or isinstance(transformer, str) and transformer == "drop"
+
+
+def _is_aligned_numeric_frames(Xt_list):
+    """Check if DataFrames share a row index and a single numeric dtype."""
+    first = Xt_list[0]
+    if not isinstance(first, pd.DataFrame) or first.shape[1] == 0:
+        return False
+    dtype = first.dtypes.iloc[0]
+    if not pd.api.types.is_numeric_dtype(dtype) or not isinstance(dtype, np.dtype):
+        return False
+    for Xt in Xt_list:
+        if (
+            not isinstance(Xt, pd.DataFrame)
+            or Xt.shape[1] == 0
+            or isinstance(Xt.columns, pd.MultiIndex)
+            or not (Xt.dtypes == dtype).all()
+            or not Xt.index.equals(first.index)
+        ):
+            return False
+    return True
+
+
+def _hstack_frames(Xt_list, keys, flatten_columns):
+    """Concatenate aligned numeric DataFrames column-wise into one buffer.
+
+    Equivalent to ``pd.concat(Xt_list, axis=1, keys=keys)`` for DataFrames passing
+    ``_is_aligned_numeric_frames``, with columns flattened if ``flatten_columns``.
+    The buffer is allocated in the transposed layout pandas stores blocks in, so
+    the returned DataFrame wraps it without a further copy. Entries of ``Xt_list``
+    are released as soon as they are copied, so peak memory stays close to one
+    copy of the output.
+    """
+    index = Xt_list[0].index
+    columns = [(key, col) for key, Xt in zip(keys, Xt_list) for col in Xt.columns]
+    values = np.empty((len(columns), len(index)), Xt_list[0].dtypes.iloc[0])
+    start = 0
+    for i in range(len(Xt_list)):
+        stop = start + Xt_list[i].shape[1]
+        values[start:stop] = Xt_list[i].to_numpy().T
+        Xt_list[i] = None
+        start = stop
+
+    if flatten_columns:
+        columns = flatten_multiindex(columns)
+    else:
+        columns = pd.MultiIndex.from_tuples(columns, names=["transformer", "variable"])
+    return pd.DataFrame(values.T, index=index, columns=columns)
+
+
 # TODO: remove in v0.11.0
 @deprecated(
     version="0.10.0",
@@ -633,12 +922,53 @@ class FitInTransform(BaseTransformer):
         self.skip_inverse_transform = skip_inverse_transform
         super().__init__()
         self.clone_tags(transformer, None)
+
+        # if fitting the inner transformer does not use the data, a single clone
+        #   is fitted in fit and reused, instead of a new clone per transform call
+        fit_is_empty = transformer.get_tag("fit_is_empty", False)
+        remember_data = transformer.get_tag("remember_data", False)
+        self._fit_once = fit_is_empty and not remember_data
+
         self.set_tags(
             **{
-                "fit_is_empty": True,
+                "fit_is_empty": not self._fit_once,
                 "skip-inverse-transform": self.skip_inverse_transform,
             }
         )
+        if self._fit_once:
+            # the fitted clone converts and vectorizes X itself in transform, as the
+            #   instances seen in transform may differ from those seen in fit
+            self.set_tags(
+                **{
+                    "X_inner_type": ALL_TIME_SERIES_TYPES,
+                    "capability:multivariate": True,
+                }
+            )
+
+    def _fit(self, X, y=None):
+        """Fit the clone of transformer reused in transform.
+
+        Only called if fitting transformer does not use the data.
+
+        Parameters
+        ----------
+        X : data structure of type X_inner_type
+            Data to fit transform to
+        y : Series or Panel of type y_inner_type, default=None
+            Additional data, e.g., labels for transformation
+
+        Returns
+        -------
+        self: a fitted instance of the estimator
+        """
+        self.transformer_ = clone(self.transformer).fit(X=X, y=y)
+        return self
+
+    def _get_fitted_transformer(self, X, y=None):
+        """Return a clone of transformer fitted to X and y."""
+        if self._fit_once:
+            return self.transformer_
+        return clone(self.transformer).fit(X=X, y=y)
 
     def _transform(self, X, y=None):
         """Transform X and return a transformed version.
@@ -657,6 +987,8 @@ class FitInTransform(BaseTransformer):
         -------
         transformed version of X
         """
+        if self._fit_once:
+            return self.transformer_.transform(X=X, y=y)
         return clone(self.transformer).fit_transform(X=X, y=y)
 
     def _inverse_transform(self, X, y=None):
@@ -676,7 +1008,7 @@ class FitInTransform(BaseTransformer):
         -------
         inverse transformed version of X
         """
-        return clone(self.transformer).fit(X=X, y=y).inverse_transform(X=X, y=y)
+        return self._get_fitted_transformer(X, y).inverse_transform(X=X, y=y)
 
     def _get_fitted_params(self):
         """Get fitted parameters.
@@ -706,6 +1038,8 @@ class FitInTransform(BaseTransformer):
             `MyClass(**params)` or `MyClass(**params[i])` creates a valid test instance.
             `create_test_instance` uses the first (or only) dictionary in `params`
         """
+        from aeon.transformations._legacy._boxcox import _BoxCoxTransformer
+
         params = [
             {"transformer": _BoxCoxTransformer()},
             {"transformer": _BoxCoxTransformer(), "skip_inverse_transform": False},
@@ -753,6 +1087,12 @@ class MultiplexTransformer(_HeterogenousMetaEstimator, _DelegatedTransformer):
            in transformers.
         selected_transformer represents the name of the transformer MultiplexTransformer
            should behave as (ie delegate all relevant transformation functionality to)
+    memory : None, str or object with the joblib.Memory interface, default=None
+        Used to cache the fitted selected transformer and its transform outputs.
+        If a string is given, it is the path to the caching directory. By default,
+        no caching is performed. Cache entries are keyed by the selected transformer
+        and the data, so switching `selected_transformer` back to a choice already
+        fitted on the same data restores it from the cache instead of refitting.
 
     Attributes
     ----------
@@ -768,23 +1108,8 @@ class MultiplexTransformer(_HeterogenousMetaEstimator, _DelegatedTransformer):
     _tags = {
         "fit_is_empty": False,
         "capability:multivariate": True,
-        "X_inner_type": [
-            "dask_panel",
-            "pd-multiindex",
-            "pd-long",
-            "df-list",
-            "xr.DataArray",
-            "pd_multiindex_hier",
-            "numpy3D",
-            "np-list",
-            "pd.DataFrame",
-            "pd.Series",
-            "dask_hierarchical",
-            "np.ndarray",
-            "dask_series",
-            "nested_univ",
-            "pd-wide",
-        ],
+        # this ensures that we convert in the inner estimator, not in the multiplexer
+        "X_inner_type": ALL_TIME_SERIES_TYPES,
     }
 
     # attribute for _DelegatedTransformer, which then delegates
@@ -806,9 +1131,11 @@ class MultiplexTransformer(_HeterogenousMetaEstimator, _DelegatedTransformer):
         self,
         transformers: list,
         selected_transformer=None,
+        memory=None,
     ):
         super().__init__()
         self.selected_transformer = selected_transformer
+        self.memory = memory
 
         self.transformers = transformers
         self._check_estimators(
@@ -817,11 +1144,15 @@ class MultiplexTransformer(_HeterogenousMetaEstimator, _DelegatedTransformer):
             cls_type=BaseTransformer,
             clone_ests=False,
         )
+        # map component names to their position, so selection is a dict lookup
+        self._name_to_idx = {name: i for i, (name, _) in enumerate(self._transformers)}
         self._set_transformer()
-        self.clone_tags(self.transformer_)
-        self.set_tags(**{"fit_is_empty": False})
-        # this ensures that we convert in the inner estimator, not in the multiplexer
-        self.set_tags(**{"X_inner_type": ALL_TIME_SERIES_TYPES})
+        # clone all tags except fit_is_empty and X_inner_type, which keep the values
+        #   in _tags
+        inner_tags = self.transformer_.get_tags()
+        self._inner_fit_is_empty = inner_tags.pop("fit_is_empty", False)
+        inner_tags.pop("X_inner_type", None)
+        self.set_tags(**inner_tags)
 
     @property
     def _transformers(self):
@@ -833,27 +1164,66 @@ class MultiplexTransformer(_HeterogenousMetaEstimator, _DelegatedTransformer):
         self.transformers = value
 
     def _check_selected_transformer(self):
-        component_names = self._get_estimator_names(
-            self._transformers, make_unique=True
-        )
         selected = self.selected_transformer
-        if selected is not None and selected not in component_names:
+        if selected is not None and selected not in self._name_to_idx:
             raise Exception(
                 f"Invalid selected_transformer parameter value provided, "
                 f" found: {selected}. Must be one of these"
-                f" valid selected_transformer parameter values: {component_names}."
+                f" valid selected_transformer parameter values: "
+                f"{list(self._name_to_idx)}."
             )
 
     def _set_transformer(self):
         self._check_selected_transformer()
         # clone the selected transformer to self.transformer_
-        if self.selected_transformer is not None:
-            for name, transformer in self._get_estimator_tuples(self.transformers):
-                if self.selected_transformer == name:
-                    self.transformer_ = transformer.clone()
-        else:
-            # if None, simply clone the first transformer to self.transformer_
-            self.transformer_ = self._get_estimator_list(self.transformers)[0].clone()
+        # if None, simply clone the first transformer to self.transformer_
+        selected = self.selected_transformer
+        idx = 0 if selected is None else self._name_to_idx[selected]
+        self.transformer_ = self._get_estimator_list(self.transformers)[idx].clone()
+
+    def _fit(self, X, y=None):
+        """Fit the selected transformer to X and y.
+
+        private _fit containing the core logic, called from fit
+
+        Parameters
+        ----------
+        X : Series or Panel, any supported type
+            Data to fit transform to
+        y : Series or Panel, default=None
+            Additional data, e.g., labels for transformation
+
+        Returns
+        -------
+        self: reference to self
+        """
+        if self._inner_fit_is_empty:
+            # nothing is learnt from the data, so there is nothing to cache
+            self.transformer_.fit(X, y)
+            return self
+        memory = check_memory(self.memory)
+        # on a cache hit, the fitted transformer is restored from the cache
+        self.transformer_ = memory.cache(_fit_one)(self.transformer_, X, y)
+        return self
+
+    def _transform(self, X, y=None):
+        """Transform X with the selected transformer.
+
+        private _transform containing core logic, called from transform
+
+        Parameters
+        ----------
+        X : Series or Panel, any supported type
+            Data to be transformed
+        y : Series or Panel, default=None
+            Additional data, e.g., labels for transformation
+
+        Returns
+        -------
+        transformed version of X
+        """
+        memory = check_memory(self.memory)
+        return memory.cache(_transform_one)(self.transformer_, X, y)
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -978,6 +1348,20 @@ class InvertTransform(_DelegatedTransformer):
         "capability:inverse_transform": True,
     }
 
+    # should be all tags, but not fit_is_empty
+    #   (_fit should not be skipped)
+    _tags_to_clone = [
+        "input_data_type",
+        "output_data_type",
+        "instancewise",
+        "X_inner_type",
+        "y_inner_type",
+        "capability:missing_values",
+        "X-y-must-have-same-index",
+        "transform-returns-same-time-index",
+        "skip-inverse-transform",
+    ]
+
     def __init__(self, transformer):
         self.transformer = transformer
 
@@ -985,20 +1369,15 @@ class InvertTransform(_DelegatedTransformer):
 
         self.transformer_ = transformer.clone()
 
-        # should be all tags, but not fit_is_empty
-        #   (_fit should not be skipped)
-        tags_to_clone = [
-            "input_data_type",
-            "output_data_type",
-            "instancewise",
-            "X_inner_type",
-            "y_inner_type",
-            "capability:missing_values",
-            "X-y-must-have-same-index",
-            "transform-returns-same-time-index",
-            "skip-inverse-transform",
-        ]
-        self.clone_tags(transformer, tag_names=tags_to_clone)
+        self.clone_tags(transformer, tag_names=self._tags_to_clone)
+
+        # X and y arrive already checked and converted to the inner transformer's
+        #   inner types, as those tags are cloned. Unless the inner transformer
+        #   vectorizes over columns or skips inverse_transform, its public methods
+        #   would only repeat these steps, so its private methods are called instead
+        self._call_inner_directly = transformer.get_tag(
+            "capability:multivariate", False
+        ) and not transformer.get_tag("skip-inverse-transform", False)
 
         if not transformer.get_tag("capability:inverse_transform", False):
             warn(
@@ -1040,6 +1419,8 @@ class InvertTransform(_DelegatedTransformer):
         Xt : aeon compatible time series container
             transformed version of X
         """
+        if self._call_inner_directly:
+            return self.transformer_._inverse_transform(X=X, y=y)
         return self.transformer_.inverse_transform(X=X, y=y)
 
     def _inverse_transform(self, X, y=None):
@@ -1062,6 +1443,8 @@ class InvertTransform(_DelegatedTransformer):
         Xt : aeon compatible time series container
             inverse transformed version of X
         """
+        if self._call_inner_directly:
+            return self.transformer_._transform(X=X, y=y)
         return self.transformer_.transform(X=X, y=y)
 
     @classmethod
@@ -1082,6 +1465,9 @@ class InvertTransform(_DelegatedTransformer):
             `MyClass(**params)` or `MyClass(**params[i])` creates a valid test instance.
             `create_test_instance` uses the first (or only) dictionary in `params`
         """
+        from aeon.testing.mock_estimators import MockTransformer
+        from aeon.transformations._legacy._boxcox import _BoxCoxTransformer
+
         params1 = {"transformer": MockTransformer()}
         # _BoxCoxTransformer has fit
         params2 = {"transformer": _BoxCoxTransformer()}
@@ -1107,6 +1493,7 @@ class Id(BaseTransformer):
         "transform-returns-same-time-index": True,
         # does transform return have the same time index as input X
         "capability:missing_values": True,  # can estimator handle missing data?
+        "transform-is-identity": True,
     }
 
     def _transform(self, X, y=None):
@@ -1205,30 +1592,38 @@ class OptionalPassthrough(_DelegatedTransformer):
         "capability:inverse_transform": True,
     }
 
+    # should be all tags, but not fit_is_empty
+    #   (_fit should not be skipped)
+    _tags_to_clone = [
+        "input_data_type",
+        "output_data_type",
+        "instancewise",
+        "y_inner_type",
+        "capability:inverse_transform",
+        "capability:missing_values",
+        "X-y-must-have-same-index",
+        "transform-returns-same-time-index",
+        "skip-inverse-transform",
+    ]
+    # tags of Id, set instead if passthrough=True
+    _passthrough_tags = {
+        "transform-returns-same-time-index": True,
+        "capability:missing_values": True,
+        "transform-is-identity": True,
+    }
+
     def __init__(self, transformer, passthrough=False):
         self.transformer = transformer
         self.passthrough = passthrough
 
         super().__init__()
 
-        # should be all tags, but not fit_is_empty
-        #   (_fit should not be skipped)
-        tags_to_clone = [
-            "input_data_type",
-            "output_data_type",
-            "instancewise",
-            "y_inner_type",
-            "capability:inverse_transform",
-            "capability:missing_values",
-            "X-y-must-have-same-index",
-            "transform-returns-same-time-index",
-            "skip-inverse-transform",
-        ]
-        self.clone_tags(transformer, tag_names=tags_to_clone)
-
         if passthrough:
+            # transform returns X, so the tags of transformer do not apply
             self.transformer_ = Id()
+            self.set_tags(**self._passthrough_tags)
         else:
+            self.clone_tags(transformer, tag_names=self._tags_to_clone)
             self.transformer_ = transformer.clone()
 
     # attribute for _DelegatedTransformer, which then delegates
@@ -1255,6 +1650,8 @@ class OptionalPassthrough(_DelegatedTransformer):
             `MyClass(**params)` or `MyClass(**params[i])` creates a valid test instance.
             `create_test_instance` uses the first (or only) dictionary in `params`
         """
+        from aeon.transformations._legacy._boxcox import _BoxCoxTransformer
+
         return {"transformer": _BoxCoxTransformer(), "passthrough": False}
 
 
@@ -1279,6 +1676,22 @@ class ColumnwiseTransformer(BaseTransformer):
     columns : list of str or None
             Names of columns that are supposed to be transformed.
             If None, all columns are transformed.
+    memory : None, str or object with the joblib.Memory interface, default=None
+        Used to cache the fitted per-column transformers and their transform outputs.
+        If a string is given, it is the path to the caching directory. By default,
+        no caching is performed. Cache entries are keyed by the transformer and the
+        column data, so refitting on identical columns, e.g., in a parameter search
+        over other estimators, restores the fitted transformers from the cache.
+    n_jobs : int or None, default=None
+        Number of jobs to run in parallel over columns.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend`
+        context.
+        ``-1`` means using all processors.
+    parallel_backend : str, ParallelBackendBase instance or None, default=None
+        Specify the parallelisation backend implementation in joblib, if None a 'prefer'
+        value of "threads" is used by default.
+        Valid options are "loky", "multiprocessing", "threading" or a custom backend.
+        See the joblib Parallel documentation for more details.
 
     Attributes
     ----------
@@ -1304,20 +1717,31 @@ class ColumnwiseTransformer(BaseTransformer):
         "fit_is_empty": False,
     }
 
-    def __init__(self, transformer, columns=None):
+    _tags_to_clone = [
+        "y_inner_type",
+        "capability:inverse_transform",
+        "capability:missing_values",
+        "X-y-must-have-same-index",
+        "transform-returns-same-time-index",
+        "skip-inverse-transform",
+    ]
+
+    def __init__(
+        self,
+        transformer,
+        columns=None,
+        memory=None,
+        n_jobs=None,
+        parallel_backend=None,
+    ):
         self.transformer = transformer
         self.columns = columns
+        self.memory = memory
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
         super().__init__()
 
-        tags_to_clone = [
-            "y_inner_type",
-            "capability:inverse_transform",
-            "capability:missing_values",
-            "X-y-must-have-same-index",
-            "transform-returns-same-time-index",
-            "skip-inverse-transform",
-        ]
-        self.clone_tags(transformer, tag_names=tags_to_clone)
+        self.clone_tags(transformer, tag_names=self._tags_to_clone)
 
     def _fit(self, X, y=None):
         """Fit transformer to X and y.
@@ -1351,14 +1775,21 @@ class ColumnwiseTransformer(BaseTransformer):
         # make sure z contains all columns that the user wants to transform
         _check_columns(X, selected_columns=self.columns_)
 
-        # fit by iterating over columns
-        self.transformers_ = {}
-        for colname in self.columns_:
-            transformer = self.transformer.clone()
-            self.transformers_[colname] = transformer
-            self.transformers_[colname].fit(X[colname], y)
+        # fit columns in parallel, on a cache hit the fitted transformer is restored
+        fit_one_cached = check_memory(self.memory).cache(_fit_one)
+        fitted = self._parallel()(
+            delayed(fit_one_cached)(self.transformer.clone(), X[colname], y)
+            for colname in self.columns_
+        )
+        self.transformers_ = dict(zip(self.columns_, fitted))
         return self
 
+    def _parallel(self):
+        """Return the joblib Parallel instance to run over columns."""
+        return Parallel(
+            n_jobs=self.n_jobs, backend=self.parallel_backend, prefer="threads"
+        )
+
     def _transform(self, X, y=None):
         """Transform X and return a transformed version.
 
@@ -1379,14 +1810,14 @@ class ColumnwiseTransformer(BaseTransformer):
         Xt : pd.DataFrame
             transformed version of X
         """
-        # make copy of z
-        X = X.copy()
-
         # make sure z contains all columns that the user wants to transform
         _check_columns(X, selected_columns=self.columns_)
-        for colname in self.columns_:
-            X[colname] = self.transformers_[colname].transform(X[colname], y)
-        return X
+        transform_one_cached = check_memory(self.memory).cache(_transform_one)
+        Xt_list = self._parallel()(
+            delayed(transform_one_cached)(self.transformers_[colname], X[colname], y)
+            for colname in self.columns_
+        )
+        return self._assemble_columns(X, Xt_list)
 
     def _inverse_transform(self, X, y=None):
         """Logic used by `inverse_transform` to reverse transformation on `X`.
@@ -1407,17 +1838,26 @@ class ColumnwiseTransformer(BaseTransformer):
         Xt : pd.DataFrame
             inverse transformed version of X
         """
-        # make copy of z
-        X = X.copy()
-
         # make sure z contains all columns that the user wants to transform
         _check_columns(X, selected_columns=self.columns_)
 
-        # iterate over columns that are supposed to be inverse_transformed
-        for colname in self.columns_:
-            X[colname] = self.transformers_[colname].inverse_transform(X[colname], y)
+        # inverse_transform columns that are supposed to be inverse_transformed
+        Xt_list = self._parallel()(
+            delayed(self.transformers_[colname].inverse_transform)(X[colname], y)
+            for colname in self.columns_
+        )
+        return self._assemble_columns(X, Xt_list)
+
+    def _assemble_columns(self, X, Xt_list):
+        """Return a new DataFrame of X with columns_ replaced by Xt_list.
 
-        return X
+        The frame is built in one pass, instead of copying X and then assigning the
+        transformed columns one by one. Transformed columns are aligned to the index
+        of X, as in column assignment.
+        """
+        columns = dict(zip(self.columns_, Xt_list))
+        data = {col: columns[col] if col in columns else X[col] for col in X.columns}
+        return pd.DataFrame(data, index=X.index, columns=X.columns)
 
     def update(self, X, y=None, update_params=True):
         """Update parameters.
@@ -1444,8 +1884,12 @@ class ColumnwiseTransformer(BaseTransformer):
 
         # make sure z contains all columns that the user wants to transform
         _check_columns(z, selected_columns=self.columns_)
-        for colname in self.columns_:
-            self.transformers_[colname].update(z[colname], X)
+        # updated transformers are returned, as workers may update copies
+        updated = self._parallel()(
+            delayed(self.transformers_[colname].update)(z[colname], X)
+            for colname in self.columns_
+        )
+        self.transformers_ = dict(zip(self.columns_, updated))
         return self
 
     @classmethod
@@ -1474,6 +1918,9 @@ class ColumnwiseTransformer(BaseTransformer):
 
 def _check_columns(z, selected_columns):
     # make sure z contains all columns that the user wants to transform
+    if isinstance(selected_columns, pd.Index) and z.columns.equals(selected_columns):
+        # common case of columns_ being all columns seen in fit, no sets needed
+        return
     z_wanted_keys = set(selected_columns)
     z_new_keys = set(z.columns)
     difference = z_wanted_keys.difference(z_new_keys)
@@ -1533,20 +1980,118 @@ class ColumnConcatenator(BaseTransformer):
           Transformed pandas DataFrame with same number of rows and single
           column
         """
+        if _is_sorted_complete_panel(X):
+            return _concatenate_columns(X)
+
         Xst = pd.DataFrame(X.stack())
         Xt = Xst.swaplevel(-2, -1).sort_index().droplevel(-2)
 
         # the above has the right structure, but the wrong indes
         # the time index is in general non-unique now, we replace it by integer index
         inst_idx = Xt.index.get_level_values(0)
-        t_idx = [range(len(Xt.loc[x])) for x in inst_idx.unique()]
-        t_idx = np.concatenate(t_idx)
+        # Xt is sorted, so each instance is a contiguous block of rows
+        t_idx = _block_positions(Xt.index.codes[0])
 
         Xt.index = pd.MultiIndex.from_arrays([inst_idx, t_idx])
         Xt.index.names = X.index.names
         return Xt
 
 
+@njit(cache=True)
+def _block_positions(codes):
+    """Return the position of each entry within its block of equal, adjacent codes.
+
+    For example, codes [3, 3, 3, 1, 1] return [0, 1, 2, 0, 1].
+    """
+    n = len(codes)
+    out = np.empty(n, dtype=np.int64)
+    k = 0
+    for i in range(n):
+        if i > 0 and codes[i] != codes[i - 1]:
+            k = 0
+        out[i] = k
+        k += 1
+    return out
+
+
+def _is_sorted_complete_panel(X):
+    """Check if X is a sorted (instance, time) panel without missing values.
+
+    For such X, the stack based concatenation in ColumnConcatenator drops no values
+    and does not reorder instances, columns or time points.
+    """
+    return (
+        X.index.nlevels == 2
+        and X.shape[1] > 0
+        and X.index.is_monotonic_increasing
+        and X.index.is_unique
+        and X.columns.is_monotonic_increasing
+        and not X.isna().to_numpy().any()
+    )
+
+
+def _concatenate_columns(X):
+    """Concatenate the columns of each instance of a panel passing the check above.
+
+    Returns a single column DataFrame with index (instance, integer time), where the
+    columns of each instance are concatenated in time.
+    """
+    values = X.to_numpy()
+    n_columns = values.shape[1]
+    inst_codes = X.index.codes[0]
+    # instances are sorted, so each instance is a contiguous block of rows
+    starts = np.flatnonzero(np.diff(inst_codes, prepend=-1))
+    counts = np.diff(starts, append=len(inst_codes))
+    instances = X.index.get_level_values(0)[starts]
+
+    if counts.min() == counts.max():
+        n_timepoints = counts[0]
+        values = values.reshape(len(starts), n_timepoints, n_columns)
+        values = values.transpose(0, 2, 1).ravel()
+        t_idx = np.tile(np.arange(n_timepoints * n_columns), len(starts))
+    else:
+        values = np.concatenate(
+            [values[i : i + n].T.ravel() for i, n in zip(starts, counts)]
+        )
+        t_idx = np.concatenate([np.arange(n * n_columns) for n in counts])
+
+    index = pd.MultiIndex.from_arrays(
+        [instances.repeat(counts * n_columns), t_idx], names=X.index.names
+    )
+    return pd.DataFrame({0: values}, index=index)
+
+
+def _subset_to_index(y, index):
+    """Return ``y.loc[index.intersection(y.index)]``.
+
+    If ``y`` and ``index`` are MultiIndex with the same levels, rows are matched on
+    their integer level codes, which avoids hashing the index tuples.
+    """
+    y_index = y.index
+    if y_index.equals(index):
+        # a copy, as from loc, so the result does not share memory with y
+        return y.copy()
+    if (
+        isinstance(y_index, pd.MultiIndex)
+        and isinstance(index, pd.MultiIndex)
+        and y_index.nlevels == index.nlevels
+        and y_index.is_unique
+        and all(a.equals(b) for a, b in zip(y_index.levels, index.levels))
+    ):
+        shape = [len(level) for level in y_index.levels]
+        try:
+            y_codes = np.ravel_multi_index(y_index.codes, shape)
+            codes = np.ravel_multi_index(index.codes, shape)
+        except ValueError:
+            # missing values in the index, or too many level combinations
+            pass
+        else:
+            # positions of the rows of y, in order of first occurrence in index
+            iloc = pd.Index(y_codes).get_indexer(pd.unique(codes))
+            return y.iloc[iloc[iloc >= 0]]
+    return y.loc[index.intersection(y_index)]
+
+
 # TODO: remove in v0.11.0
 @deprecated(
     version="0.10.0",
@@ -1601,7 +2146,7 @@ class YtoX(BaseTransformer):
         y, as a transformed version of X
         """
         if self.subset_index:
-            return y.loc[X.index.intersection(y.index)]
+            return _subset_to_index(y, X.index)
         else:
             return y
 
@@ -1623,6 +2168,6 @@ class YtoX(BaseTransformer):
         inverse transformed version of X
         """
         if self.subset_index:
-            return y.loc[X.index.intersection(y.index)]
+            return _subset_to_index(y, X.index)
         else:
             return y
@@ -106,6 +106,7 @@ class BaseTransformer(BaseEstimator):
         "transform-returns-same-time-index": False,
         # does transform return have the same time index as input X
         "skip-inverse-transform": False,  # is inverse-transform skipped when called?
+        "transform-is-identity": False,  # do transform/inverse_transform return X?
         "capability:inverse_transform": False,  # can the transformer inverse transform?
         "capability:unequal_length": True,
         "capability:unequal_length:removes": False,
@@ -440,6 +441,10 @@ class BaseTransformer(BaseEstimator):
         # check whether is fitted
         self.check_is_fitted()
 
+        # identity transformers return X, skipping input checks and conversion
+        if self.get_tag("transform-is-identity"):
+            return X
+
         # input check and conversion for X/y
         X_inner, y_inner, metadata = self._check_X_y(X=X, y=y, return_metadata=True)
 
@@ -571,6 +576,10 @@ class BaseTransformer(BaseEstimator):
         # check whether is fitted
         self.check_is_fitted()
 
+        # identity transformers return X, skipping input checks and conversion
+        if self.get_tag("transform-is-identity"):
+            return X
+
         # input check and conversion for X/y
         X_inner, y_inner, metadata = self._check_X_y(X=X, y=y, return_metadata=True)
 
@@ -78,16 +78,26 @@ class PAA(BaseCollectionTransformer):
         # parallelizing the transformation
 
         if length_TS % self.n_segments == 0:
-            X_paa = X[:, :, split_segments].mean(axis=-1)
+            # segments are consecutive blocks of equal length, a reshape gives a
+            # view with one segment per row, no indexed copy of X is needed
+            n_samples, n_channels, _ = X.shape
+            X_paa = X.reshape(
+                n_samples, n_channels, self.n_segments, length_TS // self.n_segments
+            ).mean(axis=-1)
             return X_paa
 
         else:
             n_samples, n_channels, _ = X.shape
             X_paa = np.zeros(shape=(n_samples, n_channels, self.n_segments))
 
-            for _s, segment in enumerate(split_segments):
-                if X[:, :, segment].shape[-1] > 0:  # avoids mean of empty slice error
-                    X_paa[:, :, _s] = X[:, :, segment].mean(axis=-1)
+            # segments are consecutive, so all segment sums are taken in one
+            # reduceat call on X, instead of one indexed copy of X per segment
+            lengths = np.array([len(segment) for segment in split_segments])
+            starts = np.cumsum(lengths) - lengths
+            nonempty = lengths > 0  # avoids mean of empty slice error
+            X_paa[:, :, nonempty] = (
+                np.add.reduceat(X, starts[nonempty], axis=-1) / lengths[nonempty]
+            )
 
             return X_paa
 
@@ -110,18 +120,14 @@ class PAA(BaseCollectionTransformer):
             return np.repeat(X, repeats=int(original_length / self.n_segments), axis=-1)
 
         else:
-            n_samples, n_channels, _ = X.shape
-            X_inverse_paa = np.zeros(shape=(n_samples, n_channels, original_length))
-
             all_indices = np.arange(original_length)
             split_segments = np.array_split(all_indices, self.n_segments)
 
-            for _s, segment in enumerate(split_segments):
-                X_inverse_paa[:, :, segment] = np.repeat(
-                    X[:, :, [_s]], repeats=len(segment), axis=-1
-                )
-
-            return X_inverse_paa
+            # segments are consecutive, so each segment value is repeated over its
+            # segment in one call, without an indexed copy per segment
+            lengths = [len(segment) for segment in split_segments]
+            # non-divisible lengths always give float64 output
+            return np.repeat(X, repeats=lengths, axis=-1).astype(np.float64, copy=False)
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -3,12 +3,15 @@
 __maintainer__ = []
 __all__ = ["SAX", "_invert_sax_symbols"]
 
+from functools import lru_cache
+
 import numpy as np
 import scipy.stats
-from numba import njit, prange
+from numba import get_num_threads, njit, prange, set_num_threads
 
 from aeon.transformations.collection import BaseCollectionTransformer
 from aeon.transformations.collection.dictionary_based import PAA
+from aeon.utils.validation import check_n_jobs
 
 
 class SAX(BaseCollectionTransformer):
@@ -40,6 +43,9 @@ class SAX(BaseCollectionTransformer):
         time series should be 0 and the standard deviation should be
         equal to 1. If this parameter is set to False, the z-normalization
         is applied before the transformation.
+    n_jobs : int, default = 1,
+        the number of jobs to run in parallel for `transform`. ``-1`` means using
+        all processors.
 
     Notes
     -----
@@ -74,6 +80,7 @@ class SAX(BaseCollectionTransformer):
         distribution="Gaussian",
         distribution_params=None,
         znormalized=True,
+        n_jobs=1,
     ):
         self.n_segments = n_segments
         self.alphabet_size = alphabet_size
@@ -81,6 +88,7 @@ class SAX(BaseCollectionTransformer):
 
         self.distribution_params = distribution_params
         self.znormalized = znormalized
+        self.n_jobs = n_jobs
 
         if self.distribution == "Gaussian":
             self.distribution_params_ = (
@@ -113,17 +121,18 @@ class SAX(BaseCollectionTransformer):
         X_paa : np.ndarray of shape = (n_cases, n_channels, n_segments)
             The output of the PAA transformation
         """
+        paa = PAA(n_segments=self.n_segments)
+        X_paa = paa.fit_transform(X=X)
+
         if not self.znormalized:
+            # PAA is linear, so normalizing the segment means is the same as
+            # computing PAA on the normalized series, without a normalized copy of X
             # Safe, if std is 0
-            X = (X - np.mean(X, axis=-1, keepdims=True)) / (
+            X_paa = (X_paa - np.mean(X, axis=-1, keepdims=True)) / (
                 np.std(X, axis=-1, keepdims=True) + 1e-8
             )
-
-            # Non-Safe is std is 0
-            # X = scipy.stats.zscore(X, axis=-1)
-
-        paa = PAA(n_segments=self.n_segments)
-        X_paa = paa.fit_transform(X=X)
+            # empty segments, if n_segments > n_timepoints, stay 0
+            X_paa[:, :, X.shape[-1] :] = 0
 
         return X_paa
 
@@ -147,8 +156,18 @@ class SAX(BaseCollectionTransformer):
         sax_symbols : np.ndarray of shape = (n_cases, n_channels, n_segments)
             The output of the SAX transformation
         """
-        X_paa = self._get_paa(X=X)
-        sax_symbols = self._get_sax_symbols(X_paa=X_paa)
+        n_jobs = check_n_jobs(self.n_jobs)
+        if n_jobs == 1:
+            # the serial kernel does not use the numba threads
+            return _sax_transform(
+                X, self.n_segments, self.breakpoints, self.znormalized
+            )
+        prev_threads = get_num_threads()
+        set_num_threads(n_jobs)
+        sax_symbols = _sax_transform(
+            X, self.n_segments, self.breakpoints, self.znormalized, n_jobs
+        )
+        set_num_threads(prev_threads)
         return sax_symbols
 
     def _get_sax_symbols(self, X_paa):
@@ -215,18 +234,13 @@ class SAX(BaseCollectionTransformer):
             the inverse of SAX transformation
         """
         if distribution == "Gaussian":
-            breakpoints = scipy.stats.norm.ppf(
-                np.arange(1, alphabet_size, dtype=np.float64) / alphabet_size,
-                scale=distribution_params["scale"],
-            )
-
-            breakpoints_mid = scipy.stats.norm.ppf(
-                np.arange(1, 2 * alphabet_size, 2, dtype=np.float64)
-                / (2 * self.alphabet_size),
-                scale=distribution_params["scale"],
+            breakpoints, breakpoints_mid = _gaussian_breakpoints(
+                alphabet_size, distribution_params["scale"]
             )
 
-        return breakpoints, breakpoints_mid
+        # copies, so that changes to the attributes of one instance do not change
+        # the cached breakpoints
+        return breakpoints.copy(), breakpoints_mid.copy()
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -251,6 +265,142 @@ class SAX(BaseCollectionTransformer):
         return params
 
 
+@lru_cache(maxsize=128)
+def _gaussian_breakpoints(alphabet_size, scale):
+    """Return the Gaussian breakpoints and interval midpoints of an alphabet.
+
+    Cached, as evaluating the Gaussian quantile function dominates the cost of
+    constructing a SAX instance.
+    """
+    breakpoints = scipy.stats.norm.ppf(
+        np.arange(1, alphabet_size, dtype=np.float64) / alphabet_size,
+        scale=scale,
+    )
+
+    breakpoints_mid = scipy.stats.norm.ppf(
+        np.arange(1, 2 * alphabet_size, 2, dtype=np.float64) / (2 * alphabet_size),
+        scale=scale,
+    )
+
+    return breakpoints, breakpoints_mid
+
+
+def _sax_transform(X, n_segments, breakpoints, znormalized, n_jobs=1):
+    """Transform the input time series to SAX symbols in a single pass.
+
+    Fuses the z-normalization, the PAA and the discretization of ``_get_paa`` and
+    ``_get_sax_symbols`` for each series. With ``n_jobs=1`` the cases are transformed
+    by a serial kernel that releases the GIL, so it is safe to call from several
+    threads, e.g., in ensembles using the joblib threading backend. Otherwise, the
+    cases are transformed in parallel over the current number of numba threads.
+
+    Parameters
+    ----------
+    X : np.ndarray(n_cases, n_channels, n_timepoints)
+        The input time series
+    n_segments : int
+        The number of PAA segments
+    breakpoints : np.ndarray(alphabet_size - 1)
+        The breakpoints of the alphabet, in increasing order
+    znormalized : bool
+        Whether the input time series are already z-normalized
+    n_jobs : int, default = 1
+        The number of jobs, the parallel kernel is used if it is not 1
+
+    Returns
+    -------
+    sax_symbols : np.ndarray(n_cases, n_channels, n_segments)
+        The output of the SAX transformation
+    """
+    n_timepoints = X.shape[-1]
+    # segment boundaries as in np.array_split, the first n_timepoints % n_segments
+    # segments are one time point longer
+    segment_length, n_longer = divmod(n_timepoints, n_segments)
+    starts = np.zeros(n_segments + 1, dtype=np.int64)
+    starts[1:] = np.cumsum(
+        segment_length + (np.arange(n_segments) < n_longer).astype(np.int64)
+    )
+
+    # numba's parallel layers are not all safe to enter from several threads, so
+    #   prange is only used if the transform owns the threads
+    if n_jobs == 1:
+        return _sax_transform_serial(X, starts, breakpoints, znormalized)
+    return _sax_transform_parallel(X, starts, breakpoints, znormalized)
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def _sax_transform_serial(X, starts, breakpoints, znormalized):
+    n_cases, n_channels, _ = X.shape
+    n_segments = len(starts) - 1
+    sax_symbols = np.zeros((n_cases, n_channels, n_segments), dtype=np.int64)
+    segment_sums = np.zeros(n_segments)
+    for i in range(n_cases):
+        for c in range(n_channels):
+            _sax_series(X[i, c], starts, breakpoints, znormalized, segment_sums)
+            _sax_symbols(segment_sums, breakpoints, sax_symbols[i, c])
+    return sax_symbols
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _sax_transform_parallel(X, starts, breakpoints, znormalized):
+    n_cases, n_channels, _ = X.shape
+    n_segments = len(starts) - 1
+    sax_symbols = np.zeros((n_cases, n_channels, n_segments), dtype=np.int64)
+    for i in prange(n_cases):
+        segment_sums = np.zeros(n_segments)
+        for c in range(n_channels):
+            _sax_series(X[i, c], starts, breakpoints, znormalized, segment_sums)
+            _sax_symbols(segment_sums, breakpoints, sax_symbols[i, c])
+    return sax_symbols
+
+
+@njit(fastmath=True, cache=True)
+def _sax_series(x, starts, breakpoints, znormalized, paa):
+    """Write the (normalized) PAA of series x to paa."""
+    n_segments = len(paa)
+    n_timepoints = len(x)
+
+    # one pass for the segment sums, which also give the mean of the series
+    total = 0.0
+    for s in range(n_segments):
+        segment_sum = 0.0
+        for t in range(starts[s], starts[s + 1]):
+            segment_sum += x[t]
+        paa[s] = segment_sum
+        total += segment_sum
+
+    mean = 0.0
+    std = 1.0
+    if not znormalized:
+        mean = total / n_timepoints
+        # the second pass is only needed for the deviation from the mean
+        sum_sq = 0.0
+        for t in range(n_timepoints):
+            sum_sq += (x[t] - mean) ** 2
+        # Safe, if std is 0
+        std = np.sqrt(sum_sq / n_timepoints) + 1e-8
+
+    for s in range(n_segments):
+        n_segment = starts[s + 1] - starts[s]
+        if n_segment > 0:
+            paa[s] = (paa[s] / n_segment - mean) / std
+        else:
+            # empty segments, if n_segments > n_timepoints
+            paa[s] = 0.0
+
+
+@njit(fastmath=True, cache=True)
+def _sax_symbols(paa, breakpoints, symbols):
+    """Add the symbols of paa to the zeroed symbols array."""
+    # the symbol is the number of breakpoints <= paa, as in np.digitize,
+    # counted without branching on the data. The inner loop runs over all
+    # segments for one breakpoint, so it vectorizes over contiguous arrays
+    for b in range(len(breakpoints)):
+        bp = breakpoints[b]
+        for s in range(len(paa)):
+            symbols[s] += paa[s] >= bp
+
+
 @njit(parallel=True, fastmath=True)
 def _invert_sax_symbols(sax_symbols, n_timepoints, breakpoints_mid):
     """Reconstruct the original time series using a Gaussian estimation.
@@ -273,17 +423,20 @@ def _invert_sax_symbols(sax_symbols, n_timepoints, breakpoints_mid):
     """
     n_samples, n_channels, sax_length = sax_symbols.shape
 
-    segment_length = int(n_timepoints / sax_length)
+    # integer segment boundaries as in np.array_split, so every time point is
+    # covered when n_timepoints is not divisible by sax_length
+    base, extra = divmod(n_timepoints, sax_length)
+    bounds = np.empty(sax_length + 1, dtype=np.int64)
+    for s in range(sax_length + 1):
+        bounds[s] = s * base + min(s, extra)
+
     sax_inverse = np.zeros((n_samples, n_channels, n_timepoints))
 
     for i in prange(n_samples):
-        for c in prange(n_channels):
-            for _current_sax_index in prange(sax_length):
-                start_index = _current_sax_index * segment_length
-                stop_index = start_index + segment_length
-
-                sax_inverse[i, :, start_index:stop_index] = breakpoints_mid[
-                    sax_symbols[i, c, _current_sax_index]
+        for c in range(n_channels):
+            for s in range(sax_length):
+                sax_inverse[i, c, bounds[s] : bounds[s + 1]] = breakpoints_mid[
+                    sax_symbols[i, c, s]
                 ]
 
     return sax_inverse
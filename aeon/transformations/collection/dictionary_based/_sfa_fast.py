@@ -290,9 +290,6 @@ class SFAFast(BaseCollectionTransformer):
             self.lower_bounding or self.lower_bounding_distances,
         )
 
-        if self.remove_repeat_words:
-            words = remove_repeating_words(words)
-
         if self.save_words:
             self.words = words
 
@@ -372,11 +369,9 @@ class SFAFast(BaseCollectionTransformer):
         )[0]
 
         if self.return_pandas_data_series:
-            bb = pd.DataFrame()
-            bb[0] = [pd.Series(bag) for bag in bags]
-            return bb
+            return _to_pandas_data_series(bags)
         elif self.return_sparse:
-            bags = csr_matrix(bags, dtype=np.uint32)
+            bags = _to_csr_matrix(bags)
         return bags
 
     def transform_mft(self, X):
@@ -497,11 +492,9 @@ class SFAFast(BaseCollectionTransformer):
         self.feature_count = bag_of_words.shape[1]
 
         if self.return_pandas_data_series:
-            bb = pd.DataFrame()
-            bb[0] = [pd.Series(bag) for bag in bag_of_words]
-            return bb
+            return _to_pandas_data_series(bag_of_words)
         elif self.return_sparse:
-            bag_of_words = csr_matrix(bag_of_words, dtype=np.uint32)
+            bag_of_words = _to_csr_matrix(bag_of_words)
         return bag_of_words
 
     def _binning(self, X, y=None):
@@ -896,16 +889,59 @@ def _transform_case(
     return words, dfts
 
 
+def _to_pandas_data_series(bags):
+    """Return the dense bags as a DataFrame with one pd.Series per case."""
+    # all Series share one index, and are placed in an object array, so the column
+    # is set once, instead of being inferred from a list
+    index = pd.RangeIndex(bags.shape[1])
+    column = np.empty(bags.shape[0], dtype=object)
+    for i, bag in enumerate(bags):
+        column[i] = pd.Series(bag, index=index, copy=False)
+    return pd.DataFrame({0: column})
+
+
+def _to_csr_matrix(bags):
+    """Return the dense bags as a csr_matrix of uint32 counts."""
+    data, indices, indptr = _csr_arrays(bags)
+    return csr_matrix((data, indices, indptr), shape=bags.shape)
+
+
+@njit(cache=True)
+def _csr_arrays(bags):
+    # builds the CSR arrays in two passes over the dense bags, counting the non-zero
+    # entries of each row and then copying them, without an intermediate COO matrix
+    n_cases, n_features = bags.shape
+    indptr = np.zeros(n_cases + 1, dtype=np.int64)
+    for i in range(n_cases):
+        nnz = 0
+        for j in range(n_features):
+            nnz += bags[i, j] != 0
+        indptr[i + 1] = indptr[i] + nnz
+
+    data = np.empty(indptr[-1], dtype=np.uint32)
+    indices = np.empty(indptr[-1], dtype=np.int32)
+    for i in range(n_cases):
+        k = indptr[i]
+        for j in range(n_features):
+            if bags[i, j] != 0:
+                data[k] = bags[i, j]
+                indices[k] = j
+                k += 1
+    return data, indices, indptr
+
+
 @njit(fastmath=True, cache=True)
 def remove_repeating_words(words):
     for i in range(words.shape[0]):
+        row = words[i]
+        # the previous word is kept in a register instead of being read back from
+        # the row, and the repeat is masked out without branching on the data
         last_word = 0
-        for j in range(words.shape[1]):
-            if last_word == words[i, j]:
-                # We encode the repeated words as 0 and remove them
-                # This is implementged using np.nonzero in numba. Thus must be 0
-                words[i, j] = 0
-            last_word = words[i, j]
+        for j in range(row.shape[0]):
+            # We encode the repeated words as 0 and remove them
+            # This is implementged using np.nonzero in numba. Thus must be 0
+            last_word = row[j] * (row[j] != last_word)
+            row[j] = last_word
 
     return words
 
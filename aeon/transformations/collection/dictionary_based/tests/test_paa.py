@@ -48,3 +48,32 @@ def test_equal_length_multivariate_paa(n_segments):
 
     assert X_paa.shape[-1] == n_segments
     assert X_paa_inv.shape[-1] == X.shape[-1]
+
+
+@pytest.mark.parametrize("n_timepoints", [100, 103, 5])
+def test_paa_segment_means(n_timepoints):
+    """Test that PAA returns the means of the np.array_split segments."""
+    X = np.random.default_rng(0).normal(size=(4, 2, n_timepoints))
+    n_segments = 8
+
+    X_paa = PAA(n_segments=n_segments).fit_transform(X=X)
+
+    segments = np.array_split(np.arange(n_timepoints), n_segments)
+    expected = np.stack(
+        [
+            X[:, :, segment].mean(axis=-1) if len(segment) else np.zeros(X.shape[:2])
+            for segment in segments
+        ],
+        axis=-1,
+    )
+    np.testing.assert_array_almost_equal(X_paa, expected)
+
+
+def test_inverse_paa_dtype():
+    """Test inverse PAA of non-divisible lengths returns float64."""
+    X = np.arange(6).reshape(1, 2, 3)
+
+    X_inv = PAA(n_segments=3).inverse_paa(X, original_length=10)
+
+    assert X_inv.dtype == np.float64
+    np.testing.assert_array_equal(X_inv[0, 0], [0, 0, 0, 0, 1, 1, 1, 2, 2, 2])
@@ -1,9 +1,11 @@
 """Test for SAX transformations on time series."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 
-from aeon.transformations.collection.dictionary_based import SAX
+from aeon.transformations.collection.dictionary_based import PAA, SAX
 
 
 @pytest.mark.parametrize("n_segments", [8])
@@ -54,3 +56,44 @@ def test_equal_length_multivariate_sax(n_segments, alphabet_size):
     assert X_sax_inv.shape[-1] == X.shape[-1]
     assert len(sax.breakpoints) == 3
     assert len(sax.breakpoints_mid) == 4
+
+
+@pytest.mark.parametrize("n_timepoints", [100, 103])
+@pytest.mark.parametrize("znormalized", [True, False])
+def test_sax_matches_paa_and_digitize(n_timepoints, znormalized):
+    """Test that the fused SAX transform matches PAA followed by discretization."""
+    X = np.random.default_rng(0).normal(size=(10, 2, n_timepoints)) * 2 + 1
+
+    sax = SAX(n_segments=8, alphabet_size=8, znormalized=znormalized)
+
+    X_sax = sax.fit_transform(X=X)
+    expected = sax._get_sax_symbols(X_paa=sax._get_paa(X=X))
+
+    np.testing.assert_array_equal(X_sax, expected)
+    assert X_sax.dtype == np.int64
+
+
+@pytest.mark.parametrize("n_timepoints", [64, 70])
+def test_inverse_sax_segments(n_timepoints):
+    """Test inverse SAX covers every time point of every channel like PAA."""
+    X = np.random.normal(size=(5, 3, n_timepoints))
+    sax = SAX(n_segments=8)
+    X_sax = sax.fit_transform(X)
+    X_sax_inv = sax.inverse_sax(X_sax, original_length=n_timepoints)
+    expected = PAA(n_segments=8).inverse_paa(
+        sax.breakpoints_mid[X_sax], original_length=n_timepoints
+    )
+    np.testing.assert_array_equal(X_sax_inv, expected)
+
+
+def test_sax_threads():
+    """Test SAX with n_jobs=1 can be used from several threads."""
+    X = np.random.normal(size=(20, 2, 50))
+    sax = SAX(n_segments=8, alphabet_size=4, znormalized=False)
+    expected = sax.fit_transform(X)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        X_saxs = list(executor.map(lambda _: sax.fit_transform(X), range(8)))
+
+    for X_sax in X_saxs:
+        np.testing.assert_array_equal(X_sax, expected)
@@ -6,6 +6,9 @@ import numpy as np
 import pytest
 
 from aeon.transformations.collection.dictionary_based._sfa import SFA
+from aeon.transformations.collection.dictionary_based._sfa_fast import (
+    remove_repeating_words,
+)
 
 
 @pytest.mark.parametrize(
@@ -224,3 +227,13 @@ def test_typed_dict():
     word_list2 = p2.bag_to_string(p2.transform(X, y)[0][0])
 
     assert word_list == word_list2
+
+
+def test_remove_repeating_words():
+    """Test that a repeated word is encoded as 0 and resets the repeat."""
+    words = np.array([[5, 5, 5, 3, 3, 0, 0, 7], [0, 0, 1, 1, 1, 1, 2, 2]], np.uint32)
+    expected = np.array(
+        [[5, 0, 5, 3, 0, 0, 0, 7], [0, 0, 1, 0, 1, 0, 2, 0]], dtype=np.uint32
+    )
+
+    np.testing.assert_array_equal(remove_repeating_words(words), expected)
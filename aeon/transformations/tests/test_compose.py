@@ -4,6 +4,7 @@ __maintainer__ = []
 __all__ = []
 
 import pandas as pd
+import pytest
 from sklearn.preprocessing import StandardScaler
 
 from aeon.datasets import load_airline, load_basic_motions
@@ -11,13 +12,16 @@ from aeon.testing.data_generation._legacy import get_examples
 from aeon.testing.mock_estimators import MockTransformer
 from aeon.testing.utils.deep_equals import deep_equals
 from aeon.testing.utils.estimator_checks import _assert_array_almost_equal
-from aeon.transformations._legacy._boxcox import _LogTransformer
+from aeon.transformations._legacy._boxcox import _BoxCoxTransformer, _LogTransformer
 from aeon.transformations._legacy.compose import (
     ColumnConcatenator,
+    ColumnwiseTransformer,
     FeatureUnion,
+    Id,
     InvertTransform,
     OptionalPassthrough,
     TransformerPipeline,
+    YtoX,
 )
 from aeon.transformations._legacy.impute import Imputer
 from aeon.transformations._legacy.subset import _ColumnSelect
@@ -26,6 +30,7 @@ from aeon.transformations._legacy.theta import (
     _ThetaLinesTransformer as ThetaLinesTransformer,
 )
 from aeon.transformations.collection.pad import PaddingTransformer
+from aeon.utils.multiindex import flatten_multiindex
 
 
 def test_dunder_mul():
@@ -152,6 +157,102 @@ def test_featureunion_transform_cols():
     assert deep_equals(Xt.columns, expected_cols), msg
 
 
+@pytest.mark.parametrize("parallel_backend", [None, "loky"])
+def test_featureunion_n_jobs_and_weights(parallel_backend):
+    """Test FeatureUnion gives the same output in parallel, and applies weights."""
+    X = pd.DataFrame({"test1": [1.0, 2.0], "test2": [3.0, 4.0]})
+
+    fu = FeatureUnion([("t1", MockTransformer(power=2)), ("t2", MockTransformer())])
+    fu_parallel = fu.clone().set_params(n_jobs=2, parallel_backend=parallel_backend)
+    fu_weighted = fu.clone().set_params(transformer_weights={"t2": 3})
+
+    Xt = fu.fit_transform(X)
+
+    _assert_array_almost_equal(Xt, fu_parallel.fit_transform(X))
+    assert all(est.is_fitted for _, est in fu_parallel.transformer_list_)
+
+    Xt_weighted = fu_weighted.fit_transform(X)
+    _assert_array_almost_equal(Xt_weighted["t1__test1"], Xt["t1__test1"])
+    _assert_array_almost_equal(Xt_weighted["t2__test1"], 3 * Xt["t2__test1"])
+
+
+@pytest.mark.parametrize("flatten_transform_index", [True, False])
+def test_featureunion_output_does_not_share_input(flatten_transform_index):
+    """Test that FeatureUnion output is not a view of X if a transformer returns X."""
+    X = pd.DataFrame({"test1": [1, 2], "test2": [3, 4]})
+    X_orig = X.copy()
+
+    fu = FeatureUnion(
+        [("id", Id()), ("t", MockTransformer(power=0.5))],
+        flatten_transform_index=flatten_transform_index,
+    )
+    Xt = fu.fit_transform(X)
+    Xt.iloc[0, 0] = 100
+
+    pd.testing.assert_frame_equal(X, X_orig)
+
+
+@pytest.mark.parametrize("flatten_transform_index", [True, False])
+def test_featureunion_output_does_not_share_input_view(flatten_transform_index):
+    """Test that FeatureUnion output is not a view of X if a transformer returns one."""
+    X = pd.DataFrame({"test1": [1.0, 2.0], "test2": [3, 4]})
+    X_orig = X.copy()
+
+    class _FirstColumnView(Id):
+        def _transform(self, X, y=None):
+            return X.iloc[:, :1]
+
+    fu = FeatureUnion(
+        [("first", _FirstColumnView()), ("t", MockTransformer(power=0.5))],
+        flatten_transform_index=flatten_transform_index,
+    )
+    Xt = fu.fit_transform(X)
+    Xt.iloc[0, 0] = 100
+
+    pd.testing.assert_frame_equal(X, X_orig)
+
+
+@pytest.mark.parametrize("drop", ["drop", None])
+def test_featureunion_drop(drop):
+    """Test that transformers set to "drop" or None are removed from FeatureUnion."""
+    X = pd.DataFrame({"test1": [1.0, 2.0], "test2": [3.0, 4.0]})
+
+    fu = FeatureUnion([("t1", MockTransformer(power=2)), ("t2", MockTransformer())])
+    fu.set_params(t2=drop)
+
+    assert fu._get_estimator_names(fu.transformer_list_) == ["t1"]
+    Xt = fu.fit_transform(X)
+    assert list(Xt.columns) == ["t1__test1", "t1__test2"]
+
+    with pytest.raises(ValueError, match="all transformers in transformer_list"):
+        FeatureUnion([("t1", drop), ("t2", "drop")])
+
+
+@pytest.mark.parametrize("flatten_transform_index", [True, False])
+@pytest.mark.parametrize("dtype", ["float64", "int64"])
+def test_featureunion_hstack_matches_concat(flatten_transform_index, dtype):
+    """Test the FeatureUnion output assembly matches pd.concat.
+
+    Integer input gives outputs of mixed dtype, which are not assembled in one buffer.
+    """
+    X = pd.DataFrame({"test1": [1, 2, 3], "test2": [3, 4, 5]}, dtype=dtype)
+
+    fu = FeatureUnion(
+        [("t1", MockTransformer(power=2)), ("t2", MockTransformer(power=0.5))],
+        flatten_transform_index=flatten_transform_index,
+    )
+    Xt = fu.fit_transform(X)
+
+    Xt_list = [trafo.transform(X) for _, trafo in fu.transformer_list_]
+    expected = pd.concat(
+        Xt_list, axis=1, keys=["t1", "t2"], names=["transformer", "variable"]
+    )
+    if flatten_transform_index:
+        expected.columns = flatten_multiindex(expected.columns)
+
+    pd.testing.assert_frame_equal(Xt, expected)
+
+
 def test_sklearn_after_primitives():
     """Test that sklearn transformer after primitives is correctly applied."""
     t = SummaryTransformer() * StandardScaler()
@@ -201,6 +302,89 @@ def test_pipeline_inverse():
     _assert_array_almost_equal(X, Xtt)
 
 
+def test_pipeline_skips_id_steps():
+    """Test that Id steps are passed over without changing the pipeline output."""
+    X = load_airline()
+    t = TransformerPipeline([Id(), _LogTransformer(), Id(), Imputer()])
+
+    assert t._transform_idx == [1, 3]
+    assert t._inverse_transform_idx == [1]
+
+    Xt = t.fit_transform(X)
+    _assert_array_almost_equal(Xt, (_LogTransformer() * Imputer()).fit_transform(X))
+    _assert_array_almost_equal(X, t.inverse_transform(Xt))
+
+
+@pytest.mark.parametrize("memory_hash", ["joblib", "fingerprint"])
+def test_pipeline_memory(tmp_path, memory_hash):
+    """Test that a pipeline with memory restores fitted steps from the cache."""
+    X = load_airline()
+    t = TransformerPipeline(
+        [_BoxCoxTransformer(), MockTransformer(power=2)],
+        memory=str(tmp_path),
+        memory_hash=memory_hash,
+    )
+    t_no_cache = TransformerPipeline([_BoxCoxTransformer(), MockTransformer(power=2)])
+
+    Xt = t.fit_transform(X)
+    # second fit hits the cache for all steps
+    Xt_cached = t.fit_transform(X)
+
+    _assert_array_almost_equal(Xt, Xt_cached)
+    _assert_array_almost_equal(Xt, t_no_cache.fit_transform(X))
+    _assert_array_almost_equal(Xt, t_no_cache.fit(X).transform(X))
+    assert all(est.is_fitted for _, est in t.steps_)
+
+    # a change in the first row changes the cache key for both hashes
+    X_changed = X.copy()
+    X_changed.iloc[0] += 1
+    _assert_array_almost_equal(
+        t.fit_transform(X_changed), t_no_cache.fit_transform(X_changed)
+    )
+
+
+def test_pipeline_memory_hash_invalid():
+    """Test that an unknown memory_hash raises an error in fit."""
+    t = TransformerPipeline([_BoxCoxTransformer()], memory_hash="md5")
+    with pytest.raises(ValueError, match="memory_hash"):
+        t.fit(load_airline())
+
+
+def test_columnwise_memory(tmp_path):
+    """Test that ColumnwiseTransformer with memory restores fitted columns."""
+    y = load_airline()
+    X = pd.DataFrame({"a": y, "b": 2 * y})
+    t = ColumnwiseTransformer(_BoxCoxTransformer(), memory=str(tmp_path))
+
+    Xt = t.fit_transform(X)
+    # second fit hits the cache for all columns
+    Xt_cached = t.fit_transform(X)
+
+    _assert_array_almost_equal(Xt, Xt_cached)
+    _assert_array_almost_equal(
+        Xt, ColumnwiseTransformer(_BoxCoxTransformer()).fit_transform(X)
+    )
+    assert all(est.is_fitted for est in t.transformers_.values())
+
+
+@pytest.mark.parametrize("parallel_backend", [None, "loky"])
+def test_columnwise_n_jobs(parallel_backend):
+    """Test ColumnwiseTransformer gives the same output with columns in parallel."""
+    y = load_airline()
+    X = pd.DataFrame({"a": y, "b": 2 * y, "c": 3 * y})
+    t = ColumnwiseTransformer(_BoxCoxTransformer())
+    t_parallel = ColumnwiseTransformer(
+        _BoxCoxTransformer(), n_jobs=2, parallel_backend=parallel_backend
+    )
+
+    Xt = t.fit_transform(X)
+    Xt_parallel = t_parallel.fit_transform(X)
+
+    _assert_array_almost_equal(Xt, Xt_parallel)
+    assert all(est.is_fitted for est in t_parallel.transformers_.values())
+    _assert_array_almost_equal(X, t_parallel.inverse_transform(Xt_parallel))
+
+
 def test_subset_getitem():
     """Test subsetting using the [ ] dunder, __getitem__."""
     X = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
@@ -248,6 +432,30 @@ def test_dunder_invert():
     )
 
 
+def test_invert_transform_matches_inner():
+    """Test InvertTransform swaps transform and inverse_transform of the inner."""
+    X = load_airline()
+    t = _LogTransformer().fit(X)
+    t_inv = InvertTransform(_LogTransformer()).fit(X)
+
+    _assert_array_almost_equal(t_inv.transform(X), t.inverse_transform(X))
+    _assert_array_almost_equal(t_inv.inverse_transform(X), t.transform(X))
+
+
+def test_identity_transform_returns_input():
+    """Test that identity transformers return X without conversion."""
+    X = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+
+    t_id = Id().fit(X)
+    assert t_id.transform(X) is X
+    assert t_id.inverse_transform(X) is X
+
+    t_pass = OptionalPassthrough(MockTransformer(power=2), passthrough=True)
+    assert t_pass.get_tag("transform-is-identity")
+    assert t_pass.fit(X).transform(X) is X
+    assert not OptionalPassthrough(MockTransformer()).get_tag("transform-is-identity")
+
+
 def test_dunder_neg():
     """Test the neg dunder method, for wrapping in OptionalPassthrough."""
     X = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
@@ -278,3 +486,41 @@ def test_column_concatenator():
     # check specific observations
     assert X[0][-1][-3] == Xt[0][0][-3]
     assert X[0][0][3] == Xt[0, 0][3]
+
+
+def test_column_concatenator_unequal_length():
+    """Test ColumnConcatenator on a panel of unequal length series."""
+    index = pd.MultiIndex.from_tuples(
+        [("a", 0), ("a", 1), ("b", 0), ("b", 1), ("b", 2)],
+        names=["instances", "timepoints"],
+    )
+    X = pd.DataFrame({"x": [1.0, 2.0, 3.0, 4.0, 5.0], "y": [6.0, 7.0, 8.0, 9.0, 10.0]})
+    X.index = index
+    Xt = ColumnConcatenator().fit_transform(X)
+
+    expected_index = pd.MultiIndex.from_arrays(
+        [["a"] * 4 + ["b"] * 6, [0, 1, 2, 3, 0, 1, 2, 3, 4, 5]],
+        names=["instances", "timepoints"],
+    )
+    expected = pd.DataFrame(
+        {0: [1.0, 2.0, 6.0, 7.0, 3.0, 4.0, 5.0, 8.0, 9.0, 10.0]}, index=expected_index
+    )
+    pd.testing.assert_frame_equal(Xt, expected)
+
+
+def test_ytox_subset_index():
+    """Test YtoX subsets y to the index of X on panels."""
+    index = pd.MultiIndex.from_product([range(4), range(5)], names=["i", "t"])
+    y = pd.DataFrame({"y": range(20)}, index=index, dtype=float)
+    X = pd.DataFrame({"x": 0.0}, index=index)
+    trafo = YtoX(subset_index=True)
+
+    for X_sub in [X.iloc[::3], X.iloc[[7, 2, 11]]]:
+        Xt = trafo.fit_transform(X_sub, y)
+        pd.testing.assert_frame_equal(Xt, y.loc[X_sub.index])
+
+    # the result must not share memory with y, also if no subsetting is needed
+    y_orig = y.copy()
+    Xt = trafo.fit_transform(X, y)
+    Xt.iloc[0, 0] = 100
+    pd.testing.assert_frame_equal(y, y_orig)
@@ -3,8 +3,14 @@
 __maintainer__ = []
 __all__ = []
 
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
 import numpy as np
+import pandas as pd
 
+from aeon.testing.mock_estimators import MockTransformer
+from aeon.testing.utils.deep_equals import deep_equals
 from aeon.transformations._legacy.compose import FitInTransform
 from aeon.transformations.series._boxcox import BoxCoxTransformer
 
@@ -19,3 +25,51 @@ def test_transform_fitintransform():
 
     y_hat_expected = BoxCoxTransformer().fit_transform(X_test)
     np.testing.assert_array_equal(y_hat, y_hat_expected)
+
+
+def test_fitintransform_reuses_clone_if_fit_is_empty():
+    """Test that an inner transformer with empty fit is cloned and fitted once."""
+    X_train = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+    X_test = pd.DataFrame({"a": [4.0, 5.0]})
+    inner = MockTransformer(power=2)
+    fitintransform = FitInTransform(inner, skip_inverse_transform=False)
+    fitintransform.fit(X=X_train)
+    fitted = fitintransform.transformer_
+    params = deepcopy(fitintransform.__dict__)
+
+    Xt = fitintransform.transform(X=X_test)
+    Xt_again = fitintransform.transform(X=X_test)
+
+    assert deep_equals(fitintransform.__dict__, params)
+    assert fitintransform.transformer_ is fitted
+    assert fitted is not inner and not inner.is_fitted
+    pd.testing.assert_frame_equal(Xt, MockTransformer(power=2).fit_transform(X_test))
+    pd.testing.assert_frame_equal(Xt, Xt_again)
+    pd.testing.assert_frame_equal(fitintransform.inverse_transform(X=Xt), X_test)
+
+
+def test_fitintransform_concurrent_transform():
+    """Test concurrent transform calls sharing the inner clone give the same output."""
+    X = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+    fitintransform = FitInTransform(MockTransformer(power=2)).fit(X=X)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        Xts = list(executor.map(lambda _: fitintransform.transform(X=X), range(16)))
+
+    expected = MockTransformer(power=2).fit_transform(X)
+    for Xt in Xts:
+        pd.testing.assert_frame_equal(Xt, expected)
+    assert fitintransform.transformer_.is_fitted
+
+
+def test_fitintransform_fit_once_panel():
+    """Test a clone fitted once transforms panels with other instances than in fit."""
+    index = pd.MultiIndex.from_product([range(4), range(5)])
+    X = pd.DataFrame({"a": np.arange(20.0), "b": np.arange(20.0)}, index=index)
+    X_test = X.loc[[1, 2]]
+    fitintransform = FitInTransform(MockTransformer(power=2)).fit(X=X)
+
+    pd.testing.assert_frame_equal(
+        fitintransform.transform(X=X_test),
+        MockTransformer(power=2).fit_transform(X_test),
+    )
@@ -144,3 +144,38 @@ def test_multiplex_or_dunder():
     # test we get a ValueError if we try to | with anything else:
     with pytest.raises(TypeError):
         multiplex_one | "this shouldn't work"
+
+
+def test_multiplex_transformer_memory(tmp_path):
+    """Test that MultiplexTransformer restores fitted selections from the cache."""
+    y = load_shampoo_sales()
+    transformer_tuples = [
+        ("two", MockTransformer(2)),
+        ("three", MockTransformer(3)),
+    ]
+    multiplex_transformer = MultiplexTransformer(
+        transformers=transformer_tuples, memory=str(tmp_path)
+    )
+    y_transform = {}
+    for name in ["two", "three"]:
+        multiplex_transformer.set_params(selected_transformer=name)
+        y_transform[name] = multiplex_transformer.fit_transform(X=y)
+
+    # switching back to a fitted selection hits the cache
+    multiplex_transformer.set_params(selected_transformer="two")
+    y_transform_cached = multiplex_transformer.fit_transform(X=y)
+    assert_array_equal(y_transform["two"], y_transform_cached)
+    assert_array_equal(y_transform["two"], MockTransformer(2).fit_transform(X=y))
+    assert multiplex_transformer.transformer_.is_fitted
+
+
+def test_multiplex_transformer_fit_is_empty_not_cached(tmp_path):
+    """Test that MultiplexTransformer does not cache empty fits of the selection."""
+    y = load_shampoo_sales()
+    multiplex_transformer = MultiplexTransformer(
+        transformers=[("two", MockTransformer(2))], memory=str(tmp_path)
+    )
+    multiplex_transformer.fit(X=y)
+
+    assert multiplex_transformer.transformer_.is_fitted
+    assert not any("_fit_one" in path.name for path in tmp_path.rglob("*"))